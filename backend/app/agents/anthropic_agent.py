@@ -1,13 +1,44 @@
+from functools import lru_cache, partial
 from typing import AsyncIterator
 
-from anthropic import AsyncAnthropic
+from anthropic import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncAnthropic,
+    InternalServerError,
+    RateLimitError,
+)
 
 from app.agents.base import BaseAgent
+from app.agents.http_client import build_http_client
 from app.core.config import settings
 from app.core.prompts import PromptManager, AgentType
 
 
+@lru_cache(maxsize=1)
+def _get_client() -> AsyncAnthropic:
+    """Return the process-wide AsyncAnthropic client so connections are reused."""
+    return AsyncAnthropic(
+        api_key=settings.anthropic_api_key, http_client=build_http_client()
+    )
+
+
+async def close_client() -> None:
+    """Close the shared client, if one was created, and reset the cache."""
+    if _get_client.cache_info().currsize:
+        await _get_client().close()
+        _get_client.cache_clear()
+
+
 class AnthropicAgent(BaseAgent):
+    # InternalServerError covers 529 "overloaded" responses.
+    retryable_errors = (
+        RateLimitError,
+        APITimeoutError,
+        APIConnectionError,
+        InternalServerError,
+    )
+
     def __init__(
         self,
         name: str = "Claude Agent",
@@ -15,23 +46,33 @@ class AnthropicAgent(BaseAgent):
         temperature: float = 0.8,
     ):
         super().__init__(name, model, temperature)
-        self.client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+
+    @property
+    def client(self) -> AsyncAnthropic:
+        # Built on first use, so constructing an agent (or serving a cache hit)
+        # never pays for the SDK client, and a closed client is replaced.
+        return _get_client()
+
+    async def warmup(self) -> None:
+        # Build the shared client ahead of the first request.
+        _get_client()
+
+    async def aclose(self) -> None:
+        await close_client()
+
+    async def ping(self) -> None:
+        if settings.anthropic_api_key:
+            await self.client.with_options(max_retries=0).models.list(limit=1)
 
     async def generate_hot_take(
         self, topic: str, style: str = "controversial", news_context: str = None
     ) -> str:
-        system_prompt = self.get_system_prompt(style, with_news=bool(news_context))
-        user_prompt = self.format_prompt_with_news(topic, news_context)
-
+        # Stream under the hood so a stalled upstream trips the idle timeout
+        # instead of hanging until the overall HTTP timeout.
         try:
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=250 if news_context else 200,
-                temperature=self.temperature,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}],
+            return await self._with_retries(
+                partial(self._collect_stream, topic, style, news_context)
             )
-            return response.content[0].text.strip()
         except Exception as e:
             raise RuntimeError("Anthropic generation failed") from e
 
@@ -46,13 +87,25 @@ class AnthropicAgent(BaseAgent):
                 model=self.model,
                 max_tokens=250 if news_context else 200,
                 temperature=self.temperature,
-                system=system_prompt,
+                system=self._build_system_blocks(system_prompt),
                 messages=[{"role": "user", "content": user_prompt}],
             ) as stream:
                 async for text in stream.text_stream:
                     yield text
+        except self.retryable_errors:
+            raise
         except Exception as e:
             raise RuntimeError("Anthropic streaming generation failed") from e
 
+    def _build_system_blocks(self, system_prompt: str) -> list[dict]:
+        """Wrap the system prompt as a cacheable block for Anthropic prompt caching."""
+        return [
+            {
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
     def get_system_prompt(self, style: str, with_news: bool = False) -> str:
         return PromptManager.get_full_prompt(AgentType.ANTHROPIC, style, with_news)
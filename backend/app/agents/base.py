@@ -1,8 +1,48 @@
+import asyncio
+import random
 from abc import ABC, abstractmethod
-from typing import AsyncIterator, Optional
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Static prompt fragments, pre-split around the topic and news context so a
+# request only joins strings instead of re-parsing a format template.
+_INSTRUCTION_HEAD = "Generate a single hot take about the following topic: <topic>"
+_INSTRUCTION_TAIL = (
+    "</topic>. Output only the hot take itself—no labels, headers, style names, "
+    "or alternative versions."
+)
+_NEWS_HEAD = "Topic: <topic>"
+_NEWS_MID = "</topic>\n\nRecent news context:\n"
+_NEWS_TAIL = """
+
+Instructions:
+- Base your take on the strongest evidence in the context.
+- Ignore low-signal details and unsupported claims.
+- If sources disagree, briefly note the tension.
+- Keep it punchy, but fact-grounded.
+
+""" + _INSTRUCTION_HEAD
+
+
+async def close_stream(stream: Any) -> None:
+    """Close an async generator or an SDK response stream."""
+    close = getattr(stream, "aclose", None) or getattr(stream, "close", None)
+    if close is not None:
+        await close()
 
 
 class BaseAgent(ABC):
+    # Abort a generation if the upstream stream goes quiet for this long.
+    stream_idle_timeout: float = 15.0
+    # Transient provider errors (rate limits, timeouts, dropped connections)
+    # that are retried with jittered exponential backoff.
+    retryable_errors: tuple[type[Exception], ...] = ()
+    max_attempts: int = 3
+    retry_initial_delay: float = 0.2
+    retry_max_delay: float = 2.0
+
     def __init__(self, name: str, model: str, temperature: float = 0.7):
         self.name = name
         self.model = model
@@ -13,7 +53,7 @@ class BaseAgent(ABC):
         self,
         topic: str,
         style: str = "controversial",
-        news_context: Optional[str] = None,
+        news_context: str | None = None,
     ) -> str:
         pass
 
@@ -22,7 +62,7 @@ class BaseAgent(ABC):
         self,
         topic: str,
         style: str = "controversial",
-        news_context: Optional[str] = None,
+        news_context: str | None = None,
     ) -> AsyncIterator[str]:
         """Stream hot take tokens. Subclasses implement as async generators."""
         raise NotImplementedError  # pragma: no cover
@@ -32,20 +72,78 @@ class BaseAgent(ABC):
     def get_system_prompt(self, style: str, with_news: bool = False) -> str:
         pass
 
-    def format_prompt_with_news(self, topic: str, news_context: Optional[str]) -> str:
-        """Format the user prompt to include news context if available"""
-        if news_context:
-            return f"""Topic: <topic>{topic}</topic>
+    async def warmup(self) -> None:
+        """Bind provider resources ahead of the first request."""
 
-Recent news context:
-{news_context}
+    async def aclose(self) -> None:
+        """Release provider resources on shutdown."""
 
-Instructions:
-- Base your take on the strongest evidence in the context.
-- Ignore low-signal details and unsupported claims.
-- If sources disagree, briefly note the tension.
-- Keep it punchy, but fact-grounded.
+    async def ping(self) -> None:
+        """Make a cheap request that keeps the pooled connection warm."""
+
+    async def generate_hot_takes(
+        self,
+        topic: str,
+        styles: list[str],
+        news_context: str | None = None,
+    ) -> list[str]:
+        """Generate one take per style, running the calls concurrently."""
+        tasks = [self.generate_hot_take(topic, style, news_context) for style in styles]
+        return list(await asyncio.gather(*tasks))
 
-Generate a single hot take about the following topic: <topic>{topic}</topic>. Output only the hot take itself—no labels, headers, style names, or alternative versions."""
-        else:
-            return f"Generate a single hot take about the following topic: <topic>{topic}</topic>. Output only the hot take itself—no labels, headers, style names, or alternative versions."
+    async def _iter_with_idle_timeout(self, stream: AsyncIterator) -> AsyncIterator:
+        """Yield items from ``stream``, failing if none arrives in time.
+
+        The stream is closed however iteration ends, so a timeout releases the
+        upstream HTTP stream and its pooled connection straight away.
+        """
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(
+                        anext(stream), self.stream_idle_timeout
+                    )
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            await close_stream(stream)
+
+    async def _with_retries(self, factory: Callable[[], Awaitable[T]]) -> T:
+        """Await ``factory()``, retrying ``retryable_errors`` with backoff."""
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return await factory()
+            except self.retryable_errors:
+                if attempt >= self.max_attempts:
+                    raise
+                delay = self.retry_initial_delay * 2 ** (attempt - 1)
+                await asyncio.sleep(
+                    min(self.retry_max_delay, delay * (1 + random.random()))
+                )
+        raise RuntimeError("max_attempts must be at least 1")
+
+    async def _collect_stream(
+        self, topic: str, style: str, news_context: str | None
+    ) -> str:
+        """Accumulate a streamed generation, failing if no chunk arrives in time."""
+        stream = self.generate_hot_take_stream(topic, style, news_context)
+        chunks: list[str] = []
+        async for chunk in self._iter_with_idle_timeout(stream):
+            # Trim leading whitespace as it arrives so the joined text only
+            # needs one rstrip instead of a full strip copy.
+            if not chunks:
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+            chunks.append(chunk)
+        return "".join(chunks).rstrip()
+
+    def format_prompt_with_news(self, topic: str, news_context: str | None) -> str:
+        """Format the user prompt to include news context if available"""
+        if news_context:
+            return (
+                f"{_NEWS_HEAD}{topic}{_NEWS_MID}{news_context}"
+                f"{_NEWS_TAIL}{topic}{_INSTRUCTION_TAIL}"
+            )
+        return f"{_INSTRUCTION_HEAD}{topic}{_INSTRUCTION_TAIL}"
@@ -0,0 +1,16 @@
+import httpx
+
+# Shared connection settings for the LLM provider SDK clients. HTTP/2 lets
+# concurrent generations multiplex over a single connection per provider.
+# Idle connections outlive the keep-alive ping interval so pings keep them open.
+LLM_HTTP_LIMITS = httpx.Limits(
+    max_connections=50, max_keepalive_connections=50, keepalive_expiry=90.0
+)
+LLM_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+
+def build_http_client() -> httpx.AsyncClient:
+    """Build the pooled HTTP/2 httpx client handed to a provider SDK client."""
+    return httpx.AsyncClient(
+        http2=True, limits=LLM_HTTP_LIMITS, timeout=LLM_HTTP_TIMEOUT
+    )
@@ -1,13 +1,30 @@
+from functools import lru_cache, partial
 from typing import AsyncIterator
 
-from openai import AsyncOpenAI
+from openai import APIConnectionError, APITimeoutError, AsyncOpenAI, RateLimitError
 
-from app.agents.base import BaseAgent
+from app.agents.base import BaseAgent, close_stream
+from app.agents.http_client import build_http_client
 from app.core.config import settings
 from app.core.prompts import PromptManager, AgentType
 
 
+@lru_cache(maxsize=1)
+def _get_client() -> AsyncOpenAI:
+    """Return the process-wide AsyncOpenAI client so connections are reused."""
+    return AsyncOpenAI(api_key=settings.openai_api_key, http_client=build_http_client())
+
+
+async def close_client() -> None:
+    """Close the shared client, if one was created, and reset the cache."""
+    if _get_client.cache_info().currsize:
+        await _get_client().close()
+        _get_client.cache_clear()
+
+
 class OpenAIAgent(BaseAgent):
+    retryable_errors = (RateLimitError, APITimeoutError, APIConnectionError)
+
     def __init__(
         self,
         name: str = "OpenAI Agent",
@@ -15,25 +32,33 @@ class OpenAIAgent(BaseAgent):
         temperature: float = 0.8,
     ):
         super().__init__(name, model, temperature)
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        # Built on first use, so constructing an agent (or serving a cache hit)
+        # never pays for the SDK client, and a closed client is replaced.
+        return _get_client()
+
+    async def warmup(self) -> None:
+        # Build the shared client ahead of the first request.
+        _get_client()
+
+    async def aclose(self) -> None:
+        await close_client()
+
+    async def ping(self) -> None:
+        if settings.openai_api_key:
+            await self.client.with_options(max_retries=0).models.list()
 
     async def generate_hot_take(
         self, topic: str, style: str = "controversial", news_context: str = None
     ) -> str:
-        system_prompt = self.get_system_prompt(style, with_news=bool(news_context))
-        user_prompt = self.format_prompt_with_news(topic, news_context)
-
+        # Stream under the hood so a stalled upstream trips the idle timeout
+        # instead of hanging until the overall HTTP timeout.
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=self.temperature,
-                max_tokens=250 if news_context else 200,
+            return await self._with_retries(
+                partial(self._collect_stream, topic, style, news_context)
             )
-            return response.choices[0].message.content.strip()
         except Exception as e:
             raise RuntimeError("OpenAI generation failed") from e
 
@@ -54,10 +79,16 @@ class OpenAIAgent(BaseAgent):
                 max_tokens=250 if news_context else 200,
                 stream=True,
             )
-            async for chunk in stream:
-                delta = chunk.choices[0].delta.content
-                if delta:
-                    yield delta
+            try:
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        yield delta
+            finally:
+                # Release the HTTP stream even when the consumer stops early.
+                await close_stream(stream)
+        except self.retryable_errors:
+            raise
         except Exception as e:
             raise RuntimeError("OpenAI streaming generation failed") from e
 
@@ -1,17 +1,47 @@
 import logging
 from fastapi import APIRouter, HTTPException, Response
 from fastapi.responses import StreamingResponse
-from app.models.schemas import ErrorEvent, HotTakeRequest, HotTakeResponse
+from pydantic import BaseModel
+from app.models.schemas import (
+    ErrorEvent,
+    HotTakeBatchRequest,
+    HotTakeBatchResponse,
+    HotTakeRequest,
+    HotTakeResponse,
+)
 from app.observability.langfuse import get_current_trace_id, start_request_span
 from app.services.hot_take_service import HotTakeService
+from app.services.streaming import event_frame
 
 router = APIRouter()
 hot_take_service = HotTakeService()
 logger = logging.getLogger(__name__)
 
+_STREAM_FAILED_FRAME = event_frame(
+    ErrorEvent(detail="Failed to generate. Please try again.")
+)
+
+
+def _json_response(model: BaseModel) -> Response:
+    """
+    Serialize ``model`` straight to JSON bytes with pydantic-core.
+
+    Returning a Response skips FastAPI's jsonable_encoder pass and the
+    re-validation against ``response_model``, which still documents the schema.
+    """
+    headers = {}
+    trace_id = get_current_trace_id()
+    if trace_id:
+        headers["X-Trace-Id"] = trace_id
+    return Response(
+        content=model.model_dump_json(),
+        media_type="application/json",
+        headers=headers,
+    )
+
 
 @router.post("/generate", response_model=HotTakeResponse)
-async def generate_hot_take(request: HotTakeRequest, response: Response):
+async def generate_hot_take(request: HotTakeRequest):
     payload = request.model_dump(exclude_none=True)
     with start_request_span(
         name="api.generate_hot_take",
@@ -32,8 +62,9 @@ async def generate_hot_take(request: HotTakeRequest, response: Response):
                 web_search_provider=request.web_search_provider,
                 news_days=request.news_days,
                 strict_quality_mode=request.strict_quality_mode,
+                bypass_cache=bool(request.bypass_cache),
             )
-            if span and hasattr(span, "update"):
+            if span is not None:
                 span.update(
                     output={
                         "agent_used": result.agent_used,
@@ -42,11 +73,7 @@ async def generate_hot_take(request: HotTakeRequest, response: Response):
                     }
                 )
 
-            trace_id = get_current_trace_id()
-            if trace_id:
-                response.headers["X-Trace-Id"] = trace_id
-
-            return result
+            return _json_response(result)
         except Exception as e:
             logger.exception("Failed to generate hot take")
             raise HTTPException(
@@ -54,6 +81,42 @@ async def generate_hot_take(request: HotTakeRequest, response: Response):
             ) from e
 
 
+@router.post("/generate/batch", response_model=HotTakeBatchResponse)
+async def generate_hot_takes(request: HotTakeBatchRequest):
+    """Generate one hot take per requested style for the same topic."""
+    payload = request.model_dump(exclude_none=True)
+    with start_request_span(
+        name="api.generate_hot_takes",
+        input_data=payload,
+        metadata={
+            "feature": "hot_take_generator",
+            "route": "/api/generate/batch",
+        },
+    ) as span:
+        try:
+            results = await hot_take_service.generate_hot_takes(
+                topic=request.topic,
+                styles=request.styles,
+                agent_type=request.agent_type,
+                use_web_search=request.use_web_search,
+                use_news_search=request.use_news_search,
+                max_articles=request.max_articles,
+                web_search_provider=request.web_search_provider,
+                news_days=request.news_days,
+                strict_quality_mode=request.strict_quality_mode,
+            )
+            if span is not None:
+                span.update(output={"hot_takes_count": len(results)})
+
+            return _json_response(HotTakeBatchResponse(hot_takes=results))
+        except Exception as e:
+            logger.exception("Failed to generate hot takes")
+            raise HTTPException(
+                status_code=500,
+                detail="Failed to generate hot takes. Please try again.",
+            ) from e
+
+
 @router.post("/generate/stream")
 async def generate_hot_take_stream(request: HotTakeRequest):
     """
@@ -88,15 +151,16 @@ async def generate_hot_take_stream(request: HotTakeRequest):
                     web_search_provider=request.web_search_provider,
                     news_days=request.news_days,
                     strict_quality_mode=request.strict_quality_mode,
+                    bypass_cache=bool(request.bypass_cache),
                 ):
                     yield chunk
-                if span and hasattr(span, "update"):
+                if span is not None:
                     span.update(output={"stream_completed": True})
             except Exception:
                 logger.exception("Unhandled error in streaming endpoint")
-                if span and hasattr(span, "update"):
+                if span is not None:
                     span.update(output={"stream_completed": False})
-                yield f"data: {ErrorEvent(detail='Failed to generate. Please try again.').model_dump_json()}\n\n"
+                yield _STREAM_FAILED_FRAME
 
     headers = {
         "Cache-Control": "no-cache",
@@ -37,6 +37,21 @@ class Settings(BaseSettings):
     redis_url: Optional[str] = None
     cache_ttl_seconds: int = 86400  # 24 hours
     cache_variant_pool_size: int = 5
+    # In-process cache for search-backed generations (0 entries disables)
+    response_cache_max_entries: int = 1024
+    response_cache_ttl_seconds: int = 3600
+    # In-process cache for NewsAPI results (0 entries disables)
+    news_cache_max_entries: int = 512
+    news_cache_ttl_seconds: int = 300
+    # In-process cache for web search results (0 entries disables)
+    web_cache_max_entries: int = 512
+    web_cache_ttl_seconds: int = 300
+    # Approximate token budget for search context sent to the LLM (0 disables)
+    search_context_max_tokens: int = 1500
+    # Coalesce streamed tokens into one SSE frame per window (0 disables)
+    stream_coalesce_window_ms: int = 30
+    # Ping LLM providers this often to keep pooled connections warm (0 disables)
+    llm_keepalive_interval_seconds: int = 30
     # Langfuse tracing
     langfuse_tracing_enabled: bool = True
     langfuse_public_key: Optional[str] = None
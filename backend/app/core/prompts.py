@@ -33,6 +33,16 @@ class NewsContextPrompts:
     )
 
 
+# Every (style, with_news) system prompt, composed once at import time.
+_FULL_PROMPTS: dict[tuple[str, bool], str] = {
+    (style, with_news): base_prompt
+    + (NewsContextPrompts.NEWS_SUFFIX if with_news else "")
+    for style, base_prompt in StylePrompts.BASE_PROMPTS.items()
+    for with_news in (False, True)
+}
+AVAILABLE_STYLES: tuple[str, ...] = tuple(sorted(StylePrompts.BASE_PROMPTS))
+
+
 class AgentType(Enum):
     """Enumeration of available agent types."""
 
@@ -75,6 +85,7 @@ class PromptManager:
         """
         Get the complete prompt for a specific style and news context requirement.
         Note: agent_type is kept for backward compatibility but not used.
+        Prompts are served from a table precomputed for every (style, with_news).
 
         Args:
             agent_type: The type of agent (kept for compatibility)
@@ -84,13 +95,11 @@ class PromptManager:
         Returns:
             The complete prompt string
         """
-        base_prompt = PromptManager.get_base_prompt(style)
-
-        if with_news:
-            news_suffix = PromptManager.get_news_context_suffix()
-            return base_prompt + news_suffix
-
-        return base_prompt
+        with_news = bool(with_news)
+        try:
+            return _FULL_PROMPTS[(style, with_news)]
+        except KeyError:
+            return _FULL_PROMPTS[("controversial", with_news)]
 
     @staticmethod
     def get_available_styles() -> list[str]:
@@ -100,7 +109,7 @@ class PromptManager:
         Returns:
             Sorted list of available style names
         """
-        return sorted(list(StylePrompts.BASE_PROMPTS.keys()))
+        return list(AVAILABLE_STYLES)
 
     @staticmethod
     def get_all_available_styles() -> list[str]:
@@ -110,7 +119,7 @@ class PromptManager:
         Returns:
             Sorted list of all available style names
         """
-        return PromptManager.get_available_styles()
+        return list(AVAILABLE_STYLES)
 
 
 # Convenience constants
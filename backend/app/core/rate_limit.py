@@ -0,0 +1,45 @@
+from array import array
+
+
+class RingLimiter:
+    """
+    Sliding-window limiter that keeps the last ``cap`` admission times.
+
+    Timestamps are integer nanoseconds (``time.monotonic_ns()``) held in a
+    fixed-size ``array('q')`` ring, so admitting a request is O(1), allocates
+    nothing and never boxes a float: the oldest slot is compared against the
+    window and overwritten in place once it has expired. A request may cost
+    several slots, which is how batch generation is charged per style.
+    """
+
+    __slots__ = ("buf", "cap", "count", "head")
+
+    def __init__(self, cap: int):
+        self.cap = max(0, cap)
+        self.buf = array("q", [0]) * self.cap
+        self.head = 0
+        self.count = 0
+
+    @property
+    def last(self) -> float:
+        """Most recent admission time, or ``-inf`` if nothing was admitted."""
+        if not self.count:
+            return float("-inf")
+        return self.buf[(self.head + self.count - 1) % self.cap]
+
+    def allow(self, now_ns: int, window_ns: int, cost: int = 1) -> bool:
+        """Admit ``cost`` requests at ``now_ns`` if the window has room for all."""
+        # Slots are in admission order, so when the ring is too full only the
+        # ``reclaim``-th oldest slot needs checking against the window.
+        reclaim = self.count + cost - self.cap
+        if reclaim > 0:
+            if cost > self.cap:
+                return False
+            if now_ns - self.buf[(self.head + reclaim - 1) % self.cap] <= window_ns:
+                return False
+            self.head = (self.head + reclaim) % self.cap
+            self.count -= reclaim
+        for _ in range(cost):
+            self.buf[(self.head + self.count) % self.cap] = now_ns
+            self.count += 1
+        return True
@@ -1,82 +1,172 @@
+import asyncio
+import json
 import time
-from collections import defaultdict, deque
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from app.api.routes import hot_take_service
 from app.api.routes import router as api_router
 from app.core.config import settings
-from app.observability.langfuse import flush_langfuse
+from app.core.rate_limit import RingLimiter
+from app.models.schemas import MAX_BATCH_STYLES
+from app.observability.langfuse import flush_langfuse, get_langfuse_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pay client construction at startup rather than on the first request.
+    get_langfuse_client()
+    await hot_take_service.warmup()
+    keep_alive = None
+    if settings.llm_keepalive_interval_seconds > 0:
+        keep_alive = asyncio.create_task(
+            hot_take_service.keep_alive(settings.llm_keepalive_interval_seconds)
+        )
+    yield
+    if keep_alive:
+        keep_alive.cancel()
+        with suppress(asyncio.CancelledError):
+            await keep_alive
+    flush_langfuse()
+    await hot_take_service.aclose()
+
 
 app = FastAPI(
     title="Hot Take Generator API",
     description="A FastAPI backend for generating hot takes using LLM agents",
     version="0.1.0",
-)
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.get_cors_origins(),
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    lifespan=lifespan,
 )
 
 # In-memory limiter is sufficient for single-instance personal deployments.
 rate_limit_window_seconds = 60
-request_timestamps_by_ip: dict[str, deque[float]] = defaultdict(deque)
+_RATE_LIMIT_WINDOW_NS = rate_limit_window_seconds * 1_000_000_000
+# Settings read on every generate request, bound once at import.
+_MAX_REQUEST_BYTES = settings.max_generate_request_bytes
+_RATE_LIMIT_PER_MINUTE = settings.generate_rate_limit_per_minute
+_TRUST_X_FORWARDED_FOR = settings.trust_x_forwarded_for
+request_timestamps_by_ip: dict[str, RingLimiter] = {}
+# Idle limiters are swept whenever the table doubles past this size.
+_LIMITER_SWEEP_MIN_SIZE = 1024
+_limiter_sweep_size = _LIMITER_SWEEP_MIN_SIZE
+
+
+def _get_limiter(client_ip: str, now_ns: int) -> RingLimiter:
+    global _limiter_sweep_size
+
+    limiter = request_timestamps_by_ip.get(client_ip)
+    if limiter is None:
+        if len(request_timestamps_by_ip) >= _limiter_sweep_size:
+            idle_ips = [
+                ip
+                for ip, candidate in request_timestamps_by_ip.items()
+                if now_ns - candidate.last > _RATE_LIMIT_WINDOW_NS
+            ]
+            for ip in idle_ips:
+                del request_timestamps_by_ip[ip]
+            _limiter_sweep_size = max(
+                _LIMITER_SWEEP_MIN_SIZE, 2 * len(request_timestamps_by_ip)
+            )
+        limiter = RingLimiter(_RATE_LIMIT_PER_MINUTE)
+        request_timestamps_by_ip[client_ip] = limiter
+    return limiter
 
 
 def get_client_ip(request: Request) -> str:
-    if settings.trust_x_forwarded_for:
+    if _TRUST_X_FORWARDED_FOR:
         forwarded_for = request.headers.get("x-forwarded-for")
         if forwarded_for:
             return forwarded_for.split(",")[0].strip()
     return request.client.host if request.client else "unknown"
 
 
-_GENERATE_PATHS = {"/api/generate", "/api/generate/stream"}
+_BATCH_PATH = "/api/generate/batch"
+_GENERATE_PATHS = {"/api/generate", "/api/generate/stream", _BATCH_PATH}
 
 
-@app.middleware("http")
-async def basic_rate_limit(request: Request, call_next):
-    if request.url.path in _GENERATE_PATHS and request.method.upper() == "POST":
-        content_length = request.headers.get("content-length")
-        if content_length:
-            try:
-                if int(content_length) > settings.max_generate_request_bytes:
-                    return JSONResponse(
-                        status_code=413,
-                        content={
-                            "detail": f"Request payload too large for {request.url.path}."
-                        },
-                    )
-            except ValueError:
+def basic_rate_limit(request: Request) -> JSONResponse | None:
+    """Return an error response if a generate request must be rejected."""
+    content_length = request.headers.get("content-length")
+    if content_length:
+        try:
+            if int(content_length) > _MAX_REQUEST_BYTES:
                 return JSONResponse(
-                    status_code=400,
-                    content={"detail": "Invalid Content-Length header."},
+                    status_code=413,
+                    content={
+                        "detail": f"Request payload too large for {request.url.path}."
+                    },
                 )
-
-        now = time.time()
-        client_ip = get_client_ip(request)
-        timestamps = request_timestamps_by_ip[client_ip]
-
-        while timestamps and now - timestamps[0] > rate_limit_window_seconds:
-            timestamps.popleft()
-
-        if len(timestamps) >= settings.generate_rate_limit_per_minute:
+        except ValueError:
             return JSONResponse(
-                status_code=429,
-                content={
-                    "detail": "Rate limit exceeded. Please wait before generating again."
-                },
+                status_code=400,
+                content={"detail": "Invalid Content-Length header."},
             )
 
-        timestamps.append(now)
+    # Monotonic integer clock: immune to wall-clock jumps, no float boxing.
+    now_ns = time.monotonic_ns()
+    limiter = _get_limiter(get_client_ip(request), now_ns)
+    cost = 1
+    if request.url.path == _BATCH_PATH:
+        # A batch fans out to one generation per style, but the styles aren't
+        # known until the body is read, so charge the largest batch allowed
+        # (capped at the budget, so small limits can still admit one).
+        cost = max(1, min(MAX_BATCH_STYLES, limiter.cap))
+    if not limiter.allow(now_ns, _RATE_LIMIT_WINDOW_NS, cost):
+        return JSONResponse(
+            status_code=429,
+            content={
+                "detail": "Rate limit exceeded. Please wait before generating again."
+            },
+        )
+    return None
+
+
+class GenerateRateLimitMiddleware:
+    """
+    Pure ASGI guard for the generate endpoints.
 
-    return await call_next(request)
+    Every other request is handed straight to the app after a method and path
+    check on the raw scope, without building a Request or wrapping the
+    response stream the way ``@app.middleware("http")`` does. Oversized
+    bodies are still rejected from the Content-Length header before they are
+    read.
+    """
 
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # HTTP methods are case-sensitive tokens, so compare without normalising.
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"] not in _GENERATE_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        rejection = basic_rate_limit(Request(scope))
+        if rejection is not None:
+            await rejection(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+# add_middleware wraps the existing stack, so the last one added runs first.
+# Registering CORS after the limiter keeps CORS outermost, and 413/429
+# rejections still carry CORS headers the browser can read.
+app.add_middleware(GenerateRateLimitMiddleware)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.get_cors_origins(),
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
 
 app.include_router(api_router, prefix="/api")
 
@@ -91,27 +181,32 @@ async def health_check():
     return {"status": "healthy"}
 
 
+# Readiness bodies are fixed; encode them once instead of per probe. Bytes
+# can't be mutated, so no handler can change what later probes see.
+_READY_BODY = json.dumps({"status": "ready"}).encode()
+_NOT_READY_BODY = json.dumps(
+    {
+        "status": "not_ready",
+        "missing_configuration": [
+            (
+                "At least one AI provider API key "
+                "(OPENAI_API_KEY or ANTHROPIC_API_KEY) is required"
+            )
+        ],
+    }
+).encode()
+
+
 @app.get("/ready")
-async def readiness_check(response: Response):
+async def readiness_check():
     """
     Readiness probe that verifies required environment configuration.
     Returns 200 if the service is ready to handle requests, 503 otherwise.
     """
-    missing_config = []
-
     # Check that at least one AI provider is configured
-    if not settings.openai_api_key and not settings.anthropic_api_key:
-        missing_config.append(
-            "At least one AI provider API key (OPENAI_API_KEY or ANTHROPIC_API_KEY) is required"
-        )
+    if settings.openai_api_key or settings.anthropic_api_key:
+        return Response(content=_READY_BODY, media_type="application/json")
 
-    if missing_config:
-        response.status_code = 503
-        return {"status": "not_ready", "missing_configuration": missing_config}
-
-    return {"status": "ready"}
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    flush_langfuse()
+    return Response(
+        content=_NOT_READY_BODY, status_code=503, media_type="application/json"
+    )
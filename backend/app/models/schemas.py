@@ -1,86 +1,126 @@
-from pydantic import BaseModel, field_validator
-from typing import Optional, List, Literal, Union
-from datetime import datetime
+import sys
 
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
+from typing import Annotated, Literal, Union
+from datetime import datetime
 
-class HotTakeRequest(BaseModel):
-    topic: str
-    style: Optional[str] = "controversial"
-    length: Optional[str] = "medium"
-    agent_type: Optional[str] = None  # 'openai', 'anthropic', or None for random
-    use_web_search: Optional[bool] = False
-    use_news_search: Optional[bool] = False
-    max_articles: Optional[int] = 3
-    web_search_provider: Optional[str] = None  # 'brave', 'serper', or None for auto
-    news_days: Optional[int] = 14
-    strict_quality_mode: Optional[bool] = False
-
-    @field_validator("topic")
+from app.core.prompts import StylePrompts
+
+__all__ = [
+    "MAX_BATCH_STYLES",
+    "AgentConfig",
+    "DoneEvent",
+    "ErrorEvent",
+    "HotTakeBatchRequest",
+    "HotTakeBatchResponse",
+    "HotTakeRequest",
+    "HotTakeResponse",
+    "NewsArticle",
+    "NonEmptyStr",
+    "SourceRecord",
+    "SourcesEvent",
+    "StatusEvent",
+    "StreamEvent",
+    "TokenEvent",
+    "WebSearchResult",
+]
+
+# Constraints evaluated by pydantic-core rather than Python validator callbacks.
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+NewsDays = Annotated[int, Field(ge=1, le=90)]
+
+
+def _normalize_style(v: str | None) -> str:
+    # Canonical style keys keep prompt lookups and cache keys exact.
+    if v is None:
+        return "controversial"
+    v = v.strip().lower()
+    if v not in StylePrompts.BASE_PROMPTS:
+        raise ValueError(
+            f"style must be one of: {', '.join(StylePrompts.BASE_PROMPTS)}"
+        )
+    # Only known styles reach here, so interning is bounded. The interned
+    # string is the BASE_PROMPTS key itself, so later lookups match on
+    # identity before comparing characters.
+    return sys.intern(v)
+
+
+class _HotTakeOptions(BaseModel):
+    """Fields shared by single and batch generation requests."""
+
+    topic: NonEmptyStr
+    agent_type: Literal["openai", "anthropic"] | None = None  # None for random
+    use_web_search: bool | None = False
+    use_news_search: bool | None = False
+    max_articles: int | None = 3
+    web_search_provider: Literal["brave", "serper"] | None = None  # None for auto
+    news_days: NewsDays | None = 14
+    strict_quality_mode: bool | None = False
+
+
+class HotTakeRequest(_HotTakeOptions):
+    style: str | None = "controversial"
+    # Skip cached takes and generate a fresh one.
+    bypass_cache: bool | None = False
+
+    @field_validator("style")
     @classmethod
-    def topic_must_not_be_empty(cls, v):
-        if not v or not v.strip():
-            raise ValueError("Topic cannot be empty")
-        return v.strip()
+    def validate_style(cls, v):
+        return _normalize_style(v)
 
-    @field_validator("web_search_provider")
-    @classmethod
-    def validate_provider(cls, v):
-        if v and v not in ["brave", "serper"]:
-            raise ValueError("web_search_provider must be 'brave', 'serper', or None")
-        return v
 
-    @field_validator("agent_type")
-    @classmethod
-    def validate_agent_type(cls, v):
-        if v and v not in ["openai", "anthropic"]:
-            raise ValueError("agent_type must be 'openai', 'anthropic', or None")
-        return v
+MAX_BATCH_STYLES = 5
+
+
+class HotTakeBatchRequest(_HotTakeOptions):
+    """Request several takes on one topic, one per entry in ``styles``."""
 
-    @field_validator("news_days")
+    # Reject ``style`` and other stray fields rather than silently ignoring them.
+    model_config = ConfigDict(extra="forbid")
+
+    styles: list[str]
+
+    @field_validator("styles")
     @classmethod
-    def validate_news_days(cls, v):
-        if v is None:
-            return v
-        if v < 1 or v > 90:
-            raise ValueError("news_days must be between 1 and 90")
-        return v
+    def validate_styles(cls, v):
+        if not v or len(v) > MAX_BATCH_STYLES:
+            raise ValueError(f"styles must contain 1 to {MAX_BATCH_STYLES} entries")
+        return [_normalize_style(style) for style in v]
 
 
 class SourceRecord(BaseModel):
     type: Literal["web", "news"]
     title: str
     url: str
-    snippet: Optional[str] = None
-    source: Optional[str] = None
-    published: Optional[datetime] = None
+    snippet: str | None = None
+    source: str | None = None
+    published: datetime | None = None
 
 
 class HotTakeResponse(BaseModel):
-    hot_take: str
-    topic: str
-    style: str
-    agent_used: str
-    web_search_used: Optional[bool] = False
-    news_context: Optional[str] = None
-    sources: Optional[List[SourceRecord]] = None
+    hot_take: NonEmptyStr
+    topic: NonEmptyStr
+    style: NonEmptyStr
+    agent_used: NonEmptyStr
+    web_search_used: bool | None = False
+    news_context: str | None = None
+    sources: list[SourceRecord] | None = None
+
 
-    @field_validator("hot_take", "topic", "style", "agent_used")
-    def not_empty_or_whitespace(cls, v: str, field):
-        if not v or not v.strip():
-            raise ValueError(f"{str(field)} cannot be empty or whitespace")
-        return v.strip()
+class HotTakeBatchResponse(BaseModel):
+    hot_takes: list[HotTakeResponse]
 
 
 class NewsArticle(BaseModel):
     title: str
-    summary: Optional[str] = None
+    summary: str | None = None
     url: str
-    published: Optional[datetime] = None
+    published: datetime | None = None
     source: str
 
 
 class WebSearchResult(BaseModel):
-    articles: List[NewsArticle]
+    articles: list[NewsArticle]
     search_query: str
     total_found: int
 
@@ -104,7 +144,7 @@ class StatusEvent(BaseModel):
 
 class SourcesEvent(BaseModel):
     type: Literal["sources"] = "sources"
-    sources: List[SourceRecord]
+    sources: list[SourceRecord]
 
 
 class TokenEvent(BaseModel):
@@ -118,9 +158,9 @@ class DoneEvent(BaseModel):
     topic: str
     style: str
     agent_used: str
-    web_search_used: Optional[bool] = False
-    news_context: Optional[str] = None
-    sources: Optional[List[SourceRecord]] = None
+    web_search_used: bool | None = False
+    news_context: str | None = None
+    sources: list[SourceRecord] | None = None
 
 
 class ErrorEvent(BaseModel):
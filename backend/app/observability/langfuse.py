@@ -1,5 +1,6 @@
 import logging
 from contextlib import nullcontext
+from functools import lru_cache
 from typing import Any
 
 from app.core.config import settings
@@ -11,18 +12,14 @@ try:
 except ImportError:  # pragma: no cover
     Langfuse = None  # type: ignore[assignment]
 
-_langfuse_client: Any | None = None
-_langfuse_initialized = False
+# Shared no-op context returned whenever tracing is disabled. It yields None,
+# so callers guard observation updates with a plain ``is not None`` check.
+_NULL_CONTEXT = nullcontext(None)
 
 
+@lru_cache(maxsize=1)
 def get_langfuse_client() -> Any | None:
-    global _langfuse_client, _langfuse_initialized
-
-    if _langfuse_initialized:
-        return _langfuse_client
-
-    _langfuse_initialized = True
-
+    """Build the Langfuse client once; later calls are a cache hit."""
     if not settings.langfuse_tracing_enabled:
         return None
 
@@ -35,16 +32,14 @@ def get_langfuse_client() -> Any | None:
         return None
 
     try:
-        _langfuse_client = Langfuse(
+        return Langfuse(
             public_key=settings.langfuse_public_key,
             secret_key=settings.langfuse_secret_key,
             host=settings.langfuse_base_url or settings.langfuse_host,
         )
     except Exception:
         logger.exception("Failed to initialize Langfuse client.")
-        _langfuse_client = None
-
-    return _langfuse_client
+        return None
 
 
 def start_request_span(
@@ -52,7 +47,7 @@ def start_request_span(
 ) -> Any:
     client = get_langfuse_client()
     if not client:
-        return nullcontext(None)
+        return _NULL_CONTEXT
     merged_metadata = dict(metadata)
     if settings.langfuse_tracing_environment:
         merged_metadata["environment"] = settings.langfuse_tracing_environment
@@ -71,7 +66,7 @@ def start_generation_observation(
 ) -> Any:
     client = get_langfuse_client()
     if not client:
-        return nullcontext(None)
+        return _NULL_CONTEXT
     merged_metadata = dict(metadata)
     if settings.langfuse_tracing_environment:
         merged_metadata["environment"] = settings.langfuse_tracing_environment
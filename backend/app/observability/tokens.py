@@ -0,0 +1,21 @@
+import math
+from functools import lru_cache
+
+# Conservative bytes-per-token ratio for English BPE vocabularies (GPT and Claude).
+_BYTES_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of ``text`` from its UTF-8 length."""
+    return math.ceil(len(text.encode("utf-8")) / _BYTES_PER_TOKEN)
+
+
+@lru_cache(maxsize=64)
+def count_prompt_tokens(prompt: str) -> int:
+    """
+    Estimate the token count of a system prompt for trace metadata.
+
+    System prompts come from a closed (style, with_news) set, so the count is
+    memoized and the request path never re-measures the largest static string.
+    """
+    return estimate_tokens(prompt)
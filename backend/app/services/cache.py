@@ -1,9 +1,8 @@
-import json
 import logging
 import random
-from typing import Optional
 
 from app.core.config import settings
+from app.services.response_cache import normalize_topic
 
 logger = logging.getLogger(__name__)
 
@@ -25,75 +24,57 @@ class CacheService:
         else:
             logger.info("No REDIS_URL configured, caching disabled")
 
-    def _make_key(self, topic: str, style: str, agent_type: Optional[str]) -> str:
-        topic_norm = topic.lower().strip()
+    def _make_key(self, topic: str, style: str, agent_type: str | None) -> str:
+        # v2 keys hold Redis lists; legacy JSON-string pools simply expire.
+        topic_norm = normalize_topic(topic)
         if agent_type:
-            return f"hot_take:{topic_norm}:{style}:{agent_type}"
-        return f"hot_take:{topic_norm}:{style}"
+            return f"hot_take:v2:{topic_norm}:{style}:{agent_type}"
+        return f"hot_take:v2:{topic_norm}:{style}"
 
-    def _normalize_pool(self, raw_data: str) -> list[dict]:
-        parsed = json.loads(raw_data)
-        if isinstance(parsed, list):
-            return [item for item in parsed if isinstance(item, dict)]
-        if isinstance(parsed, dict):
-            return [parsed]
-        return []
-
-    def _dedupe_and_trim(self, variants: list[dict]) -> list[dict]:
-        deduped: list[dict] = []
-        seen = set()
-        for item in variants:
-            try:
-                fingerprint = json.dumps(item, sort_keys=True)
-            except TypeError:
-                continue
-            if fingerprint in seen:
-                continue
-            seen.add(fingerprint)
-            deduped.append(item)
-        return deduped[-self.max_variants :]
-
-    async def get_random_variant(
-        self, topic: str, style: str, agent_type: Optional[str]
-    ) -> tuple[Optional[dict], int]:
+    async def get_random_payload(
+        self, topic: str, style: str, agent_type: str | None
+    ) -> tuple[str | None, int]:
+        """Return one stored variant as raw JSON, plus the pool size."""
         if not self._client:
             return None, 0
         try:
             key = self._make_key(topic, style, agent_type)
-            data = await self._client.get(key)
-            if data:
-                variants = self._normalize_pool(data)
-                if not variants:
-                    return None, 0
-                logger.debug("Cache hit: %s (variants=%d)", key, len(variants))
-                return random.choice(variants), len(variants)
+            # Pools are small, so one LRANGE beats an LLEN + LINDEX round trip.
+            entries = await self._client.lrange(key, 0, -1)
+            if entries:
+                logger.debug("Cache hit: %s (variants=%d)", key, len(entries))
+                return random.choice(entries), len(entries)
         except Exception as e:
             logger.warning("Cache get failed: %s", e)
         return None, 0
 
-    async def add_variant(
-        self, topic: str, style: str, agent_type: Optional[str], value: dict
+    async def add_variant_payload(
+        self, topic: str, style: str, agent_type: str | None, payload: str
     ) -> int:
+        """
+        Store an already-serialized variant; return the resulting pool size.
+
+        Payloads must be deterministic for a given value (e.g. pydantic's
+        ``model_dump_json``) so that re-adding a variant replaces it.
+        """
         if not self._client:
             return 0
         try:
             key = self._make_key(topic, style, agent_type)
-            existing_raw = await self._client.get(key)
-            variants = []
-            if existing_raw:
-                variants = self._normalize_pool(existing_raw)
-            variants.append(value)
-            variants = self._dedupe_and_trim(variants)
-            await self._client.setex(
-                key, settings.cache_ttl_seconds, json.dumps(variants)
-            )
+            pipe = self._client.pipeline(transaction=True)
+            pipe.lrem(key, 0, payload)
+            pipe.lpush(key, payload)
+            pipe.ltrim(key, 0, self.max_variants - 1)
+            pipe.expire(key, settings.cache_ttl_seconds)
+            _, pushed_len, _, _ = await pipe.execute()
+            pool_size = min(pushed_len, self.max_variants)
             logger.debug(
                 "Cache set: %s (variants=%d ttl=%ds)",
                 key,
-                len(variants),
+                pool_size,
                 settings.cache_ttl_seconds,
             )
-            return len(variants)
+            return pool_size
         except Exception as e:
             logger.warning("Cache set failed: %s", e)
             return 0
@@ -1,10 +1,15 @@
+import asyncio
 import logging
 import random
-from typing import Any, AsyncIterator, Dict, List, Optional
+from collections.abc import AsyncIterator
+from functools import lru_cache, partial
+from typing import Any
 
 from app.agents.anthropic_agent import AnthropicAgent
+from app.agents.base import BaseAgent
 from app.agents.openai_agent import OpenAIAgent
-from app.core.prompts import PromptManager
+from app.core.config import settings
+from app.core.prompts import AVAILABLE_STYLES
 from app.models.schemas import (
     AgentConfig,
     DoneEvent,
@@ -13,51 +18,143 @@ from app.models.schemas import (
     SourceRecord,
     SourcesEvent,
     StatusEvent,
-    TokenEvent,
 )
 from app.observability.langfuse import start_generation_observation
+from app.observability.tokens import count_prompt_tokens, estimate_tokens
 from app.services.cache import CacheService
 from app.services.news_search_service import NewsSearchService
+from app.services.response_cache import ResponseCache
+from app.services.search_providers.http_client import close_search_client
+from app.services.search_quality import normalize_url
+from app.services.singleflight import SingleFlight
+from app.services.streaming import coalesce_tokens, event_frame, token_frame
 from app.services.web_search_service import WebSearchService
 
 logger = logging.getLogger(__name__)
 
+_AGENT_DESCRIPTIONS = {
+    "openai": "Generates hot takes with OpenAI models.",
+    "anthropic": "Generates hot takes with Anthropic Claude models.",
+}
+
+# Fixed-text stream events, encoded once.
+_CACHED_TAKE_FRAME = event_frame(StatusEvent(message="Serving cached take..."))
+_SEARCHING_WEB_FRAME = event_frame(StatusEvent(message="Searching the web..."))
+_SEARCHING_NEWS_FRAME = event_frame(StatusEvent(message="Searching recent news..."))
+_GENERATION_FAILED_FRAME = event_frame(
+    ErrorEvent(detail="Generation failed. Please try again.")
+)
+
+
+async def _no_results() -> list[dict[str, Any]]:
+    return []
+
+
+# Pools are full and hot once takes are served from cache, so the same few
+# payloads come back repeatedly; decode and encode each one only once.
+@lru_cache(maxsize=256)
+def _decode_cached_take(payload: str) -> HotTakeResponse:
+    """
+    Decode a cached payload into a response shared by every hit on it.
+
+    The instance is read-only by contract: routes only serialize it. A memo
+    hit is a dict lookup, whereas re-validating a payload with a handful of
+    sources costs roughly 10µs and a defensive deep copy several times that,
+    which is why callers get the shared object rather than a copy.
+    """
+    return HotTakeResponse.model_validate_json(payload)
+
+
+@lru_cache(maxsize=256)
+def _cached_take_frames(payload: str) -> tuple[str, ...]:
+    """Token frames replaying a cached take word by word, then its done frame."""
+    cached = _decode_cached_take(payload)
+    words = cached.hot_take.split()
+    frames = [token_frame(word + " ") for word in words[:-1]]
+    frames.extend(token_frame(word) for word in words[-1:])
+    frames.append(event_frame(DoneEvent(**cached.model_dump())))
+    return tuple(frames)
+
 
 class HotTakeService:
     def __init__(self):
         self.agents = {"openai": OpenAIAgent(), "anthropic": AnthropicAgent()}
+        # Agents are fixed for the service lifetime; snapshot them for selection.
+        self._agent_names = tuple(self.agents)
+        self._agent_values = tuple(self.agents.values())
+        self._agents_metadata: tuple[AgentConfig, ...] | None = None
         self.web_search_service = WebSearchService()
+        # Provider-pinned search services, built on first use per provider.
+        self._provider_web_search_services: dict[str, WebSearchService] = {}
         self.news_search_service = NewsSearchService()
         self.cache = CacheService()
+        # Search-backed takes skip the Redis variant pool; reuse identical
+        # (agent, style, topic, context) generations in-process instead.
+        self.response_cache = ResponseCache(
+            max_entries=settings.response_cache_max_entries,
+            ttl_seconds=settings.response_cache_ttl_seconds,
+        )
+        self.inflight = SingleFlight()
+
+    def _select_agent(self, agent_type: str | None) -> BaseAgent:
+        """Return the requested agent, or a random one when unspecified."""
+        if agent_type in self.agents:
+            return self.agents[agent_type]
+        return random.choice(self._agent_values)
+
+    async def warmup(self) -> None:
+        """Build shared provider clients so the first request skips cold start."""
+        await asyncio.gather(*(agent.warmup() for agent in self.agents.values()))
+
+    async def aclose(self) -> None:
+        """Close shared provider clients."""
+        await asyncio.gather(
+            *(agent.aclose() for agent in self.agents.values()),
+            close_search_client(),
+        )
+
+    async def keep_alive(self, interval_seconds: float) -> None:
+        """Ping each provider every ``interval_seconds`` until cancelled."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            results = await asyncio.gather(
+                *(agent.ping() for agent in self.agents.values()),
+                return_exceptions=True,
+            )
+            for agent, result in zip(self.agents.values(), results, strict=True):
+                if isinstance(result, Exception):
+                    logger.debug(
+                        "Keep-alive ping failed for %s: %s", agent.name, result
+                    )
 
     async def generate_hot_take(
         self,
         topic: str,
         style: str = "controversial",
-        agent_type: str = None,
+        agent_type: str | None = None,
         use_web_search: bool = False,
         use_news_search: bool = False,
         max_articles: int = 3,
-        web_search_provider: Optional[str] = None,
-        news_days: Optional[int] = None,
+        web_search_provider: str | None = None,
+        news_days: int | None = None,
         strict_quality_mode: bool = False,
+        bypass_cache: bool = False,
     ) -> HotTakeResponse:
-        if agent_type and agent_type in self.agents:
-            agent = self.agents[agent_type]
-        else:
-            agent = random.choice(list(self.agents.values()))
+        agent = self._select_agent(agent_type)
 
         # Check cache for no-search requests only.
         # Strategy: keep generating fresh takes until variant pool is full,
-        # then serve a random cached variant.
+        # then serve a random cached variant. ``bypass_cache`` always generates
+        # a fresh take, which is still stored for later requests.
         use_search = use_web_search or use_news_search
+        use_cached = not bypass_cache
         cache_pool_size = 0
-        if not use_search:
-            cached, cache_pool_size = await self.cache.get_random_variant(
+        if not use_search and use_cached:
+            cached, cache_pool_size = await self.cache.get_random_payload(
                 topic, style, agent_type
             )
             if cached and cache_pool_size >= self.cache.max_variants:
-                cached_response = HotTakeResponse.model_validate(cached)
+                cached_response = _decode_cached_take(cached)
                 with start_generation_observation(
                     name="llm.generate_hot_take",
                     input_data={
@@ -78,7 +175,7 @@ class HotTakeService:
                     model="cache",
                     model_parameters={},
                 ) as generation:
-                    if generation and hasattr(generation, "update"):
+                    if generation is not None:
                         generation.update(
                             output=cached_response.hot_take,
                             metadata={
@@ -88,58 +185,128 @@ class HotTakeService:
                         )
                 return cached_response
 
-        # Gather context from various sources
-        context_parts = []
-        source_records: List[SourceRecord] = []
-
-        # Web search context (general web results)
-        if use_web_search:
-            try:
-                # Create service with specific provider if requested
-                if web_search_provider:
-                    web_service = WebSearchService(provider_name=web_search_provider)
-                else:
-                    web_service = self.web_search_service
+        combined_context, source_records = await self._gather_search_context(
+            topic,
+            use_web_search=use_web_search,
+            use_news_search=use_news_search,
+            max_articles=max_articles,
+            web_search_provider=web_search_provider,
+            news_days=news_days,
+            strict_quality_mode=strict_quality_mode,
+        )
 
-                web_results = await web_service.search(
-                    topic,
-                    max_articles,
-                    strict_quality_mode=strict_quality_mode,
-                )
-                web_context = web_service.format_search_context(web_results)
-                if web_context and "No web search results" not in web_context:
-                    context_parts.append(web_context)
-                source_records.extend(self._build_web_source_records(web_results))
-            except Exception as e:
-                logger.warning("Web search failed: %s", e)
-
-        # News search context (news articles)
-        news_context = None
-        if use_news_search:
-            try:
-                news_articles = await self.news_search_service.search_recent_news(
-                    topic,
-                    max_articles,
-                    days_back=news_days,
-                    strict_quality_mode=strict_quality_mode,
+        generation_key = ResponseCache.make_key(
+            agent.name, style, topic, combined_context
+        )
+        hot_take = None
+        if use_search and use_cached:
+            hot_take = self.response_cache.get(generation_key)
+            if hot_take is not None:
+                logger.debug(
+                    "Response cache hit for topic='%s' style='%s'", topic, style
                 )
-                news_context = self.news_search_service.format_news_context(
-                    news_articles
+
+        if hot_take is None:
+            with start_generation_observation(
+                name="llm.generate_hot_take",
+                input_data={
+                    "topic": topic,
+                    "style": style,
+                    "has_context": bool(combined_context),
+                },
+                metadata={
+                    "agent_type": agent_type or "random",
+                    "agent_name": agent.name,
+                    "use_web_search": use_web_search,
+                    "use_news_search": use_news_search,
+                    "news_days": news_days,
+                    "strict_quality_mode": strict_quality_mode,
+                    "cache_hit": False,
+                    "cache_pool_size": cache_pool_size,
+                },
+                model=agent.model,
+                model_parameters={
+                    "temperature": agent.temperature,
+                    "max_tokens": 250 if combined_context else 200,
+                },
+            ) as generation:
+                generate = partial(
+                    agent.generate_hot_take, topic, style, combined_context
                 )
-                if news_context and "No recent news found" not in news_context:
-                    context_parts.append(news_context)
-                source_records.extend(self._build_news_source_records(news_articles))
-            except Exception as e:
-                logger.warning("News search failed: %s", e)
+                # Identical concurrent search requests share one upstream call.
+                # Non-search and bypassing requests each need a fresh take.
+                if use_search and use_cached:
+                    hot_take = await self.inflight.do(generation_key, generate)
+                else:
+                    hot_take = await generate()
+                if generation is not None:
+                    generation.update(
+                        output=hot_take,
+                        metadata={
+                            "sources_count": len(source_records),
+                            "system_prompt_tokens": count_prompt_tokens(
+                                agent.get_system_prompt(style, bool(combined_context))
+                            ),
+                        },
+                    )
+            if use_search:
+                self.response_cache.set(generation_key, hot_take)
+
+        result = HotTakeResponse(
+            hot_take=hot_take,
+            topic=topic,
+            style=style,
+            agent_used=agent.name,
+            web_search_used=use_search and combined_context is not None,
+            news_context=combined_context if use_search else None,
+            sources=source_records if source_records else None,
+        )
+
+        if not use_search:
+            cache_pool_size = await self.cache.add_variant_payload(
+                topic, style, agent_type, result.model_dump_json()
+            )
+            logger.debug(
+                "Cached non-search take for topic='%s' style='%s' (pool_size=%d)",
+                topic,
+                style,
+                cache_pool_size,
+            )
+
+        return result
+
+    async def generate_hot_takes(
+        self,
+        topic: str,
+        styles: list[str],
+        agent_type: str | None = None,
+        use_web_search: bool = False,
+        use_news_search: bool = False,
+        max_articles: int = 3,
+        web_search_provider: str | None = None,
+        news_days: int | None = None,
+        strict_quality_mode: bool = False,
+    ) -> list[HotTakeResponse]:
+        """Generate one take per style for a topic, sharing search context and
+        letting the agent batch the provider calls."""
+        agent = self._select_agent(agent_type)
 
-        # Combine all context
-        combined_context = "\n\n".join(context_parts) if context_parts else None
+        use_search = use_web_search or use_news_search
+        combined_context, source_records = await self._gather_search_context(
+            topic,
+            use_web_search=use_web_search,
+            use_news_search=use_news_search,
+            max_articles=max_articles,
+            web_search_provider=web_search_provider,
+            news_days=news_days,
+            strict_quality_mode=strict_quality_mode,
+        )
 
         with start_generation_observation(
-            name="llm.generate_hot_take",
+            name="llm.generate_hot_takes",
             input_data={
                 "topic": topic,
-                "style": style,
+                "styles": styles,
                 "has_context": bool(combined_context),
             },
             metadata={
@@ -149,8 +316,7 @@ class HotTakeService:
                 "use_news_search": use_news_search,
                 "news_days": news_days,
                 "strict_quality_mode": strict_quality_mode,
-                "cache_hit": False,
-                "cache_pool_size": cache_pool_size,
+                "batch_size": len(styles),
             },
             model=agent.model,
             model_parameters={
@@ -158,136 +324,212 @@ class HotTakeService:
                 "max_tokens": 250 if combined_context else 200,
             },
         ) as generation:
-            hot_take = await agent.generate_hot_take(topic, style, combined_context)
-            if generation and hasattr(generation, "update"):
+            hot_takes = await agent.generate_hot_takes(topic, styles, combined_context)
+            if generation is not None:
                 generation.update(
-                    output=hot_take,
+                    output=hot_takes,
                     metadata={"sources_count": len(source_records)},
                 )
 
-        result = HotTakeResponse(
-            hot_take=hot_take,
-            topic=topic,
-            style=style,
-            agent_used=agent.name,
-            web_search_used=use_search and combined_context is not None,
-            news_context=combined_context if use_search else None,
-            sources=source_records if source_records else None,
+        return [
+            HotTakeResponse(
+                hot_take=hot_take,
+                topic=topic,
+                style=style,
+                agent_used=agent.name,
+                web_search_used=use_search and combined_context is not None,
+                news_context=combined_context if use_search else None,
+                sources=source_records if source_records else None,
+            )
+            for style, hot_take in zip(styles, hot_takes, strict=True)
+        ]
+
+    async def _gather_search_context(
+        self,
+        topic: str,
+        *,
+        use_web_search: bool,
+        use_news_search: bool,
+        max_articles: int,
+        web_search_provider: str | None,
+        news_days: int | None,
+        strict_quality_mode: bool,
+    ) -> tuple[str | None, list[SourceRecord]]:
+        """Run the requested searches concurrently; return (context, sources)."""
+        # Web and news lookups are independent round-trips; overlap them.
+        web_results, news_articles = await asyncio.gather(
+            (
+                self._search_web(
+                    topic, max_articles, web_search_provider, strict_quality_mode
+                )
+                if use_web_search
+                else _no_results()
+            ),
+            (
+                self._search_news(topic, max_articles, news_days, strict_quality_mode)
+                if use_news_search
+                else _no_results()
+            ),
         )
 
-        if not use_search:
-            cache_pool_size = await self.cache.add_variant(
-                topic, style, agent_type, result.model_dump(mode="json")
+        if web_results and news_articles:
+            # The same story often turns up in both; keep only the web copy so
+            # it is neither sent to the LLM nor listed as a source twice.
+            web_urls = {normalize_url(r.get("url", "")) for r in web_results}
+            web_urls.discard("")
+            news_articles = [
+                article
+                for article in news_articles
+                if normalize_url(article.get("url", "")) not in web_urls
+            ]
+
+        combined_context = self._format_search_context(
+            web_results if use_web_search else None,
+            news_articles if use_news_search else None,
+        )
+        budget = settings.search_context_max_tokens
+        while (
+            budget > 0
+            and combined_context
+            and estimate_tokens(combined_context) > budget
+            and (web_results or news_articles)
+        ):
+            # Results arrive ranked; drop the weakest from the longer list.
+            if len(news_articles) >= len(web_results):
+                news_articles = news_articles[:-1]
+            else:
+                web_results = web_results[:-1]
+            combined_context = self._format_search_context(
+                web_results if use_web_search else None,
+                news_articles if use_news_search else None,
             )
-            logger.debug(
-                "Cached non-search take for topic='%s' style='%s' (pool_size=%d)",
+
+        source_records: list[SourceRecord] = []
+        if use_web_search:
+            source_records.extend(self._build_web_source_records(web_results))
+        if use_news_search:
+            source_records.extend(self._build_news_source_records(news_articles))
+        return combined_context, source_records
+
+    def _format_search_context(
+        self,
+        web_results: list[dict[str, Any]] | None,
+        news_articles: list[dict[str, Any]] | None,
+    ) -> str | None:
+        """Web then news context joined for the prompt; None skips a source."""
+        context_parts: list[str] = []
+        if web_results is not None:
+            web_context = self.web_search_service.format_search_context(web_results)
+            if web_context:
+                context_parts.append(web_context)
+        if news_articles is not None:
+            news_context = self.news_search_service.format_news_context(news_articles)
+            if news_context:
+                context_parts.append(news_context)
+        return "\n\n".join(context_parts) or None
+
+    def _get_web_search_service(
+        self, web_search_provider: str | None
+    ) -> WebSearchService:
+        """Return the default search service, or the one pinned to a provider."""
+        if not web_search_provider:
+            return self.web_search_service
+        web_service = self._provider_web_search_services.get(web_search_provider)
+        if web_service is None:
+            web_service = WebSearchService(provider_name=web_search_provider)
+            self._provider_web_search_services[web_search_provider] = web_service
+        return web_service
+
+    async def _search_web(
+        self,
+        topic: str,
+        max_articles: int,
+        web_search_provider: str | None,
+        strict_quality_mode: bool,
+    ) -> list[dict[str, Any]]:
+        """Web search results; failures degrade to no results."""
+        try:
+            web_service = self._get_web_search_service(web_search_provider)
+            return await web_service.search(
                 topic,
-                style,
-                cache_pool_size,
+                max_articles,
+                strict_quality_mode=strict_quality_mode,
             )
+        except Exception as e:
+            logger.warning("Web search failed: %s", e)
+            return []
 
-        return result
+    async def _search_news(
+        self,
+        topic: str,
+        max_articles: int,
+        news_days: int | None,
+        strict_quality_mode: bool,
+    ) -> list[dict[str, Any]]:
+        """News search results; failures degrade to no results."""
+        try:
+            return await self.news_search_service.search_recent_news(
+                topic,
+                max_articles,
+                days_back=news_days,
+                strict_quality_mode=strict_quality_mode,
+            )
+        except Exception as e:
+            logger.warning("News search failed: %s", e)
+            return []
 
     async def stream_hot_take(
         self,
         topic: str,
         style: str = "controversial",
-        agent_type: str = None,
+        agent_type: str | None = None,
         use_web_search: bool = False,
         use_news_search: bool = False,
         max_articles: int = 3,
-        web_search_provider: Optional[str] = None,
-        news_days: Optional[int] = None,
+        web_search_provider: str | None = None,
+        news_days: int | None = None,
         strict_quality_mode: bool = False,
+        bypass_cache: bool = False,
     ) -> AsyncIterator[str]:
         """Async generator yielding SSE-formatted event strings."""
-
-        def sse(event) -> str:
-            return f"data: {event.model_dump_json()}\n\n"
-
-        if agent_type and agent_type in self.agents:
-            agent = self.agents[agent_type]
-        else:
-            agent = random.choice(list(self.agents.values()))
+        agent = self._select_agent(agent_type)
 
         use_search = use_web_search or use_news_search
 
         # Cache check (non-search requests only)
-        if not use_search:
-            cached, cache_pool_size = await self.cache.get_random_variant(
+        if not use_search and not bypass_cache:
+            cached, cache_pool_size = await self.cache.get_random_payload(
                 topic, style, agent_type
             )
             if cached and cache_pool_size >= self.cache.max_variants:
-                cached_response = HotTakeResponse.model_validate(cached)
-                yield sse(StatusEvent(message="Serving cached take..."))
-                # Replay cached text as fake token chunks for consistent UX
-                words = cached_response.hot_take.split()
-                for i, word in enumerate(words):
-                    suffix = " " if i < len(words) - 1 else ""
-                    yield sse(TokenEvent(text=word + suffix))
-                yield sse(
-                    DoneEvent(
-                        hot_take=cached_response.hot_take,
-                        topic=cached_response.topic,
-                        style=cached_response.style,
-                        agent_used=cached_response.agent_used,
-                        web_search_used=cached_response.web_search_used,
-                        news_context=cached_response.news_context,
-                        sources=cached_response.sources,
-                    )
-                )
+                yield _CACHED_TAKE_FRAME
+                for frame in _cached_take_frames(cached):
+                    yield frame
                 return
 
         # Search phase
-        context_parts: List[str] = []
-        source_records: List[SourceRecord] = []
-
         if use_web_search:
-            yield sse(StatusEvent(message="Searching the web..."))
-            try:
-                web_service = (
-                    WebSearchService(provider_name=web_search_provider)
-                    if web_search_provider
-                    else self.web_search_service
-                )
-                web_results = await web_service.search(
-                    topic, max_articles, strict_quality_mode=strict_quality_mode
-                )
-                web_context = web_service.format_search_context(web_results)
-                if web_context and "No web search results" not in web_context:
-                    context_parts.append(web_context)
-                source_records.extend(self._build_web_source_records(web_results))
-            except Exception as e:
-                logger.warning("Web search failed: %s", e)
-
+            yield _SEARCHING_WEB_FRAME
         if use_news_search:
-            yield sse(StatusEvent(message="Searching recent news..."))
-            try:
-                news_articles = await self.news_search_service.search_recent_news(
-                    topic,
-                    max_articles,
-                    days_back=news_days,
-                    strict_quality_mode=strict_quality_mode,
-                )
-                news_context = self.news_search_service.format_news_context(
-                    news_articles
-                )
-                if news_context and "No recent news found" not in news_context:
-                    context_parts.append(news_context)
-                source_records.extend(self._build_news_source_records(news_articles))
-            except Exception as e:
-                logger.warning("News search failed: %s", e)
+            yield _SEARCHING_NEWS_FRAME
+        combined_context, source_records = await self._gather_search_context(
+            topic,
+            use_web_search=use_web_search,
+            use_news_search=use_news_search,
+            max_articles=max_articles,
+            web_search_provider=web_search_provider,
+            news_days=news_days,
+            strict_quality_mode=strict_quality_mode,
+        )
 
         # Emit sources before generation starts so the UI can show them
         if source_records:
-            yield sse(SourcesEvent(sources=source_records))
-
-        combined_context = "\n\n".join(context_parts) if context_parts else None
+            yield event_frame(SourcesEvent(sources=source_records))
 
-        yield sse(StatusEvent(message=f"Generating with {agent.name}..."))
+        yield event_frame(StatusEvent(message=f"Generating with {agent.name}..."))
 
         # Stream LLM tokens
-        tokens: List[str] = []
+        tokens: list[str] = []
         hot_take = ""
         with start_generation_observation(
             name="llm.generate_hot_take_stream",
@@ -313,14 +555,15 @@ class HotTakeService:
             },
         ) as generation:
             try:
-                async for token in agent.generate_hot_take_stream(
-                    topic, style, combined_context
+                async for token in coalesce_tokens(
+                    agent.generate_hot_take_stream(topic, style, combined_context),
+                    settings.stream_coalesce_window_ms / 1000,
                 ):
                     tokens.append(token)
-                    yield sse(TokenEvent(text=token))
+                    yield token_frame(token)
             except Exception:
                 logger.exception("Streaming generation failed")
-                if generation and hasattr(generation, "update"):
+                if generation is not None:
                     generation.update(
                         output="",
                         metadata={
@@ -328,16 +571,19 @@ class HotTakeService:
                             "sources_count": len(source_records),
                         },
                     )
-                yield sse(ErrorEvent(detail="Generation failed. Please try again."))
+                yield _GENERATION_FAILED_FRAME
                 return
 
             hot_take = "".join(tokens).strip()
-            if generation and hasattr(generation, "update"):
+            if generation is not None:
                 generation.update(
                     output=hot_take,
                     metadata={
                         "stream_completed": True,
                         "sources_count": len(source_records),
+                        "system_prompt_tokens": count_prompt_tokens(
+                            agent.get_system_prompt(style, bool(combined_context))
+                        ),
                     },
                 )
 
@@ -351,19 +597,7 @@ class HotTakeService:
             sources=source_records if source_records else None,
         )
 
-        # Cache non-search results
-        if not use_search:
-            cache_pool_size = await self.cache.add_variant(
-                topic, style, agent_type, result.model_dump(mode="json")
-            )
-            logger.debug(
-                "Cached streaming take for topic='%s' style='%s' (pool_size=%d)",
-                topic,
-                style,
-                cache_pool_size,
-            )
-
-        yield sse(
+        yield event_frame(
             DoneEvent(
                 hot_take=hot_take,
                 topic=topic,
@@ -375,67 +609,73 @@ class HotTakeService:
             )
         )
 
-    def get_available_agents(self) -> List[str]:
-        return list(self.agents.keys())
+        # Cache non-search results once the client already has the done event,
+        # so the Redis round trip does not hold back the end of the stream.
+        if not use_search:
+            cache_pool_size = await self.cache.add_variant_payload(
+                topic, style, agent_type, result.model_dump_json()
+            )
+            logger.debug(
+                "Cached streaming take for topic='%s' style='%s' (pool_size=%d)",
+                topic,
+                style,
+                cache_pool_size,
+            )
 
-    def get_available_agents_metadata(self) -> List[AgentConfig]:
-        descriptions = {
-            "openai": "Generates hot takes with OpenAI models.",
-            "anthropic": "Generates hot takes with Anthropic Claude models.",
-        }
-        return [
-            AgentConfig(
-                id=agent_id,
-                name=agent.name,
-                description=descriptions.get(agent_id, "AI agent"),
-                model=agent.model,
-                temperature=agent.temperature,
-                system_prompt=agent.get_system_prompt("controversial"),
+    def get_available_agents(self) -> list[str]:
+        return list(self._agent_names)
+
+    def get_available_agents_metadata(self) -> list[AgentConfig]:
+        # Agent configuration is fixed for the process; build the configs once.
+        if self._agents_metadata is None:
+            self._agents_metadata = tuple(
+                AgentConfig(
+                    id=agent_id,
+                    name=agent.name,
+                    description=_AGENT_DESCRIPTIONS.get(agent_id, "AI agent"),
+                    model=agent.model,
+                    temperature=agent.temperature,
+                    system_prompt=agent.get_system_prompt("controversial"),
+                )
+                for agent_id, agent in self.agents.items()
             )
-            for agent_id, agent in self.agents.items()
-        ]
+        return list(self._agents_metadata)
 
-    def get_available_styles(self) -> List[str]:
-        return PromptManager.get_all_available_styles()
+    def get_available_styles(self) -> list[str]:
+        return list(AVAILABLE_STYLES)
 
+    # Search results are normalised by our own services, so records are built
+    # with model_construct and skip re-validating every field.
     def _build_web_source_records(
-        self, results: List[Dict[str, Any]]
-    ) -> List[SourceRecord]:
-        records: List[SourceRecord] = []
-        for result in results:
-            title = result.get("title", "").strip()
-            url = result.get("url", "").strip()
-            if not title or not url:
-                continue
-            records.append(
-                SourceRecord(
-                    type="web",
-                    title=title,
-                    url=url,
-                    snippet=result.get("snippet", "") or None,
-                    source=result.get("source", "") or None,
-                    published=result.get("published"),
-                )
+        self, results: list[dict[str, Any]]
+    ) -> list[SourceRecord]:
+        return [
+            SourceRecord.model_construct(
+                type="web",
+                title=title,
+                url=url,
+                snippet=result.get("snippet") or None,
+                source=result.get("source") or None,
+                published=result.get("published"),
             )
-        return records
+            for result in results
+            if (title := result.get("title", "").strip())
+            and (url := result.get("url", "").strip())
+        ]
 
     def _build_news_source_records(
-        self, articles: List[Dict[str, Any]]
-    ) -> List[SourceRecord]:
-        records: List[SourceRecord] = []
-        for article in articles:
-            title = article.get("title", "").strip()
-            url = article.get("url", "").strip()
-            if not title or not url:
-                continue
-            records.append(
-                SourceRecord(
-                    type="news",
-                    title=title,
-                    url=url,
-                    snippet=article.get("summary", "") or None,
-                    source=article.get("source", "") or None,
-                    published=article.get("published"),
-                )
+        self, articles: list[dict[str, Any]]
+    ) -> list[SourceRecord]:
+        return [
+            SourceRecord.model_construct(
+                type="news",
+                title=title,
+                url=url,
+                snippet=article.get("summary") or None,
+                source=article.get("source") or None,
+                published=article.get("published"),
             )
-        return records
+            for article in articles
+            if (title := article.get("title", "").strip())
+            and (url := article.get("url", "").strip())
+        ]
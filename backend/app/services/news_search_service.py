@@ -1,9 +1,15 @@
 import asyncio
-from typing import List, Dict, Any
-from datetime import datetime, timedelta, timezone
-from newsapi import NewsApiClient
+import heapq
+from functools import partial
+from operator import itemgetter
+from typing import Any
+from datetime import datetime, timedelta, UTC
+from pydantic_core import from_json
 from app.core.config import settings
+from app.services.response_cache import ResponseCache, normalize_topic
 import logging
+from app.services.search_providers.http_client import get_search_client
+from app.services.singleflight import SingleFlight
 from app.services.search_quality import (
     SearchQualityConfig,
     apply_recency_window,
@@ -16,6 +22,73 @@ from app.services.search_quality import (
 
 logger = logging.getLogger(__name__)
 
+NEWSAPI_EVERYTHING_URL = "https://newsapi.org/v2/everything"
+
+
+class AsyncNewsApiClient:
+    """
+    Minimal async client for NewsAPI's ``/v2/everything`` endpoint.
+
+    Keeps newsapi-python's ``get_everything`` keyword names, but requests go
+    through the pooled HTTP/2 client shared with the web search providers
+    instead of a blocking ``requests`` call on a worker thread.
+    """
+
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+
+    async def get_everything(
+        self,
+        *,
+        q: str,
+        language: str,
+        sort_by: str,
+        page_size: int,
+        from_param: str | None = None,
+    ) -> dict[str, Any]:
+        params = {
+            "q": q,
+            "language": language,
+            "sortBy": sort_by,
+            "pageSize": page_size,
+        }
+        if from_param:
+            params["from"] = from_param
+        response = await get_search_client().get(
+            NEWSAPI_EVERYTHING_URL,
+            params=params,
+            headers={"X-Api-Key": self.api_key},
+        )
+        # Error responses carry a JSON body with status "error"; the caller
+        # checks status, so the HTTP code isn't raised here.
+        return from_json(response.content)
+
+
+def _parse_newsapi_article(article: dict[str, Any]) -> dict[str, Any] | None:
+    """Map one NewsAPI article onto the shared record shape, or None."""
+    try:
+        get = article.get
+        published_at = get("publishedAt")
+        published_date = None
+        if published_at:
+            try:
+                # 3.11+ parses the trailing "Z" itself.
+                published_date = datetime.fromisoformat(published_at)
+            except ValueError:
+                logger.warning("Could not parse date: %s", published_at)
+
+        return {
+            "title": get("title", ""),
+            # Use description or content as summary
+            "summary": get("description", "") or get("content", ""),
+            "url": get("url", ""),
+            "published": published_date,
+            "source": get("source", {}).get("name", ""),
+        }
+    except Exception as e:
+        logger.warning("Error parsing article: %s", e)
+        return None
+
 
 class NewsSearchService:
     """Service for searching news articles using NewsAPI."""
@@ -23,7 +96,7 @@ class NewsSearchService:
     def __init__(self):
         # Initialize NewsAPI client with API key from settings
         self.newsapi_client = (
-            NewsApiClient(api_key=settings.newsapi_api_key)
+            AsyncNewsApiClient(api_key=settings.newsapi_api_key)
             if settings.newsapi_api_key
             else None
         )
@@ -36,6 +109,14 @@ class NewsSearchService:
         self.blocklist = self._quality.blocklist
         self.trusted_domains = self._quality.trusted_domains
         self.score_weights = self._quality.score_weights
+        # Repeat searches for a trending topic reuse one NewsAPI round trip.
+        raw_entries = getattr(settings, "news_cache_max_entries", 512)
+        raw_ttl = getattr(settings, "news_cache_ttl_seconds", 300)
+        self.results_cache = ResponseCache(
+            max_entries=raw_entries if isinstance(raw_entries, int) else 512,
+            ttl_seconds=raw_ttl if isinstance(raw_ttl, int) else 300,
+        )
+        self.inflight = SingleFlight()
 
     async def search_recent_news(
         self,
@@ -43,44 +124,62 @@ class NewsSearchService:
         max_results: int = 5,
         days_back: int | None = None,
         strict_quality_mode: bool = False,
-    ) -> List[Dict[str, Any]]:
+    ) -> list[dict[str, Any]]:
         """Search for recent news articles related to the topic using NewsAPI."""
         if not self.newsapi_client:
             logger.warning("NewsAPI client not initialized (missing API key)")
             return []
 
         effective_days = days_back if days_back is not None else self.default_days
+        cache_key = (
+            f"{normalize_topic(topic)}|{max_results}|{effective_days}"
+            f"|{strict_quality_mode}"
+        )
+        cached = self.results_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
 
         try:
-            # Run the synchronous NewsAPI call in a thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            articles = await loop.run_in_executor(
-                None,
+            fetch = partial(
                 self._fetch_news_api_articles,
                 topic,
                 max_results,
                 effective_days,
                 strict_quality_mode,
             )
-            return articles
+            # Bound the whole search so a slow NewsAPI can't hold up web
+            # results gathered alongside it.
+            articles = await self.inflight.do(
+                cache_key,
+                lambda: asyncio.wait_for(fetch(), self.search_timeout),
+            )
+            # Empty results may be a swallowed upstream error; don't pin them.
+            if articles:
+                self.results_cache.set(cache_key, articles)
+            return list(articles)
+        except TimeoutError:
+            logger.warning("NewsAPI search timed out after %ss", self.search_timeout)
+            return []
         except Exception as e:
-            logger.error(f"NewsAPI search failed: {e}")
+            logger.error("NewsAPI search failed: %s", e)
             return []
 
-    def _fetch_news_api_articles(
+    async def _fetch_news_api_articles(
         self,
         topic: str,
         max_results: int,
         days_back: int,
         strict_quality_mode: bool,
-    ) -> List[Dict[str, Any]]:
-        """Fetch articles from NewsAPI (synchronous method)."""
+    ) -> list[dict[str, Any]]:
+        """Fetch, parse and rank articles from NewsAPI."""
         try:
             from_date = None
             if days_back > 0:
                 from_date = (
-                    datetime.now(timezone.utc) - timedelta(days=max(1, days_back))
-                ).strftime("%Y-%m-%d")
+                    (datetime.now(UTC) - timedelta(days=max(1, days_back)))
+                    .date()
+                    .isoformat()
+                )
             query = self._build_news_query(topic, strict_quality_mode)
             request_params = {
                 "q": query,
@@ -90,43 +189,17 @@ class NewsSearchService:
             }
             if from_date:
                 request_params["from_param"] = from_date
-            response = self.newsapi_client.get_everything(**request_params)
+            response = await self.newsapi_client.get_everything(**request_params)
 
             if response.get("status") != "ok":
-                logger.error(f"NewsAPI returned status: {response.get('status')}")
+                logger.error("NewsAPI returned status: %s", response.get("status"))
                 return []
 
-            articles = []
-            for article in response.get("articles", []):
-                try:
-                    # Parse the published date
-                    published_at = article.get("publishedAt")
-                    published_date = None
-                    if published_at:
-                        try:
-                            published_date = datetime.fromisoformat(
-                                published_at.replace("Z", "+00:00")
-                            )
-                        except ValueError:
-                            logger.warning(f"Could not parse date: {published_at}")
-
-                    # Use description or content as summary
-                    summary = article.get("description", "")
-                    if not summary:
-                        summary = article.get("content", "")
-
-                    articles.append(
-                        {
-                            "title": article.get("title", ""),
-                            "summary": summary,
-                            "url": article.get("url", ""),
-                            "published": published_date,
-                            "source": article.get("source", {}).get("name", ""),
-                        }
-                    )
-                except Exception as e:
-                    logger.warning(f"Error parsing article: {e}")
-                    continue
+            articles = [
+                parsed
+                for article in response.get("articles", [])
+                if (parsed := _parse_newsapi_article(article)) is not None
+            ]
 
             return self._rank_and_filter_articles(
                 topic=topic,
@@ -137,7 +210,7 @@ class NewsSearchService:
             )
 
         except Exception as e:
-            logger.error(f"Error fetching NewsAPI articles: {e}")
+            logger.error("Error fetching NewsAPI articles: %s", e)
             return []
 
     def _build_news_query(self, topic: str, strict_quality_mode: bool) -> str:
@@ -152,13 +225,14 @@ class NewsSearchService:
         self,
         *,
         topic: str,
-        articles: List[Dict[str, Any]],
+        articles: list[dict[str, Any]],
         max_results: int,
         days_back: int,
         strict_quality_mode: bool,
-    ) -> List[Dict[str, Any]]:
+    ) -> list[dict[str, Any]]:
         topic_tokens = tokenize(topic)
-        filtered: List[Dict[str, Any]] = []
+        topic_lower = topic.strip().lower()
+        filtered: list[dict[str, Any]] = []
 
         for article in articles:
             title = (article.get("title") or "").strip()
@@ -171,48 +245,62 @@ class NewsSearchService:
                 continue
             article["_domain"] = domain
 
-            if strict_quality_mode:
-                summary = (article.get("summary") or "").strip()
-                overlap = len(topic_tokens & tokenize(f"{title} {summary}"))
-                if len(summary) < 90 or overlap == 0:
-                    continue
+            summary = (article.get("summary") or "").strip()
+            # Tokenized once here and reused by score_record below.
+            text_tokens = tokenize(f"{title} {summary}")
+            # Only emptiness matters here; isdisjoint stops at the first shared
+            # token and builds no intersection set.
+            if strict_quality_mode and (
+                len(summary) < 90 or topic_tokens.isdisjoint(text_tokens)
+            ):
+                continue
+            article["_text_tokens"] = text_tokens
             filtered.append(article)
 
         deduped = dedupe_records(filtered)
+        # One clock read serves the recency window and every score below.
+        now = datetime.now(UTC)
         recent = (
-            apply_recency_window(deduped, max(1, days_back))
+            apply_recency_window(deduped, max(1, days_back), now=now)
             if days_back > 0
             else deduped
         )
 
+        # Scores live beside the records rather than on them, so nothing has
+        # to be popped afterwards; the key is computed once per candidate.
+        scored = []
         for item in recent:
             domain = item.get("_domain") or extract_domain(item.get("url", ""))
-            item["_quality_score"] = score_record(
+            score = score_record(
                 {**item, "source": domain},
                 topic_tokens=topic_tokens,
                 topic_text=topic,
                 trusted_domains=self.trusted_domains,
                 recency_days=max(7, days_back),
                 strict_quality_mode=strict_quality_mode,
+                text_tokens=item.get("_text_tokens"),
+                now=now,
+                topic_lower=topic_lower,
                 **self.score_weights,
             )
+            scored.append(((score, bool(item.get("published"))), item))
 
-        ranked = sorted(
-            recent,
-            key=lambda r: (r.get("_quality_score", 0.0), bool(r.get("published"))),
-            reverse=True,
-        )
-        final_articles = ranked[:max_results]
+        # Top-k selection; only max_results of the candidates are kept.
+        final_articles = [
+            item for _, item in heapq.nlargest(max_results, scored, key=itemgetter(0))
+        ]
         for item in final_articles:
-            item.pop("_quality_score", None)
             item.pop("_domain", None)
+            item.pop("_text_tokens", None)
         return final_articles
 
-    def format_news_context(self, articles: List[Dict[str, Any]]) -> str:
-        """Format news articles into a context string for the LLM."""
+    def format_news_context(self, articles: list[dict[str, Any]]) -> str | None:
+        """Format news articles into a context string for the LLM, or None."""
         if not articles:
-            return "No recent news found on this topic."
+            return None
 
+        # Collect fragments and join once rather than growing a string per
+        # article.
         context_parts = ["Recent news and headlines:"]
 
         for i, article in enumerate(articles, 1):
@@ -226,19 +314,17 @@ class NewsSearchService:
             if len(summary) > 200:
                 summary = summary[:197] + "..."
 
-            article_text = f"\n{i}. {title}"
+            context_parts.append(f"\n\n{i}. {title}")
             if source:
-                article_text += f" ({source})"
+                context_parts.append(f" ({source})")
             if published:
-                article_text += f" - {published.strftime('%Y-%m-%d')}"
+                context_parts.append(f" - {published.date().isoformat()}")
             if summary:
-                article_text += f"\n   {summary}"
+                context_parts.append(f"\n   {summary}")
             if url:
-                article_text += f"\n   URL: {url}"
-
-            context_parts.append(article_text)
+                context_parts.append(f"\n   URL: {url}")
 
-        return "\n".join(context_parts)
+        return "".join(context_parts)
 
     async def search_and_format(
         self,
@@ -246,8 +332,8 @@ class NewsSearchService:
         max_results: int = 5,
         days_back: int | None = None,
         strict_quality_mode: bool = False,
-    ) -> str:
-        """Search for news and return formatted context string."""
+    ) -> str | None:
+        """Search for news and return formatted context, or None if no articles."""
         articles = await self.search_recent_news(
             topic,
             max_results,
@@ -0,0 +1,53 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+_TOPIC_EDGE_PUNCTUATION = " .,;:!?'\""
+
+
+def normalize_topic(topic: str) -> str:
+    """
+    Canonical cache form of a topic.
+
+    Case, runs of whitespace and surrounding punctuation do not change the
+    take, so "AI  Regulation?" and "ai regulation" share cache entries.
+    """
+    return " ".join(topic.casefold().split()).strip(_TOPIC_EDGE_PUNCTUATION)
+
+
+class ResponseCache:
+    """Bounded in-process TTL cache for generated takes and search results."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    @staticmethod
+    def make_key(agent_name: str, style: str, topic: str, context: str | None) -> str:
+        context_hash = hashlib.sha1((context or "").encode()).hexdigest()
+        raw = f"{agent_name}|{style}|{normalize_topic(topic)}|{context_hash}"
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        if not self.max_entries:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
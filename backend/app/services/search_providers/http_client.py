@@ -0,0 +1,26 @@
+from functools import lru_cache
+
+import httpx
+
+# One pooled client serves every search provider, so repeat searches reuse
+# warm TLS connections instead of paying a handshake per query. Providers
+# still pass their own headers and per-request timeout.
+SEARCH_HTTP_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0
+)
+SEARCH_HTTP_TIMEOUT = httpx.Timeout(15.0, connect=5.0)
+
+
+@lru_cache(maxsize=1)
+def get_search_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP/2 client used by the search providers."""
+    return httpx.AsyncClient(
+        http2=True, limits=SEARCH_HTTP_LIMITS, timeout=SEARCH_HTTP_TIMEOUT
+    )
+
+
+async def close_search_client() -> None:
+    """Close the shared client, if one was created, and reset the cache."""
+    if get_search_client.cache_info().currsize:
+        await get_search_client().aclose()
+        get_search_client.cache_clear()
@@ -1,9 +1,11 @@
 import httpx
 import logging
+from pydantic_core import from_json
 from typing import List, Dict, Any
 from .base import SearchProvider
+from .http_client import get_search_client
 from app.core.config import settings
-from app.services.search_quality import parse_date_string
+from app.services.search_quality import extract_domain, parse_date_string
 
 logger = logging.getLogger(__name__)
 
@@ -23,34 +25,36 @@ class SerperSearchProvider(SearchProvider):
             return []
 
         try:
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    "X-API-KEY": self.api_key,
-                    "Content-Type": "application/json",
-                }
-
-                payload = {
-                    "q": query,
-                    "num": min(max_results, 10),  # Serper typically supports up to 10
-                }
-
-                response = await client.post(
-                    self.base_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=self.timeout,
-                )
-
-                response.raise_for_status()
-                data = response.json()
-
-                return self._parse_results(data)
+            client = get_search_client()
+            headers = {
+                "X-API-KEY": self.api_key,
+                "Content-Type": "application/json",
+            }
+
+            payload = {
+                "q": query,
+                "num": min(max_results, 10),  # Serper typically supports up to 10
+            }
+
+            response = await client.post(
+                self.base_url,
+                headers=headers,
+                json=payload,
+                timeout=self.timeout,
+            )
+
+            response.raise_for_status()
+            # pydantic-core's Rust parser; faster than stdlib json on these
+            # multi-KB result pages.
+            data = from_json(response.content)
+
+            return self._parse_results(data)
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"Serper API HTTP error: {e.response.status_code}")
+            logger.error("Serper API HTTP error: %s", e.response.status_code)
             return []
         except Exception as e:
-            logger.error(f"Serper API error: {e}")
+            logger.error("Serper API error: %s", e)
             return []
 
     def _parse_results(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -73,24 +77,14 @@ class SerperSearchProvider(SearchProvider):
                     }
                 )
             except Exception as e:
-                logger.warning(f"Error parsing Serper search result: {e}")
+                logger.warning("Error parsing Serper search result: %s", e)
                 continue
 
         return results
 
     def _extract_domain(self, url: str) -> str:
         """Extract domain name from URL."""
-        try:
-            from urllib.parse import urlparse
-
-            parsed = urlparse(url)
-            domain = parsed.netloc
-            # Remove 'www.' prefix if present
-            if domain.startswith("www."):
-                domain = domain[4:]
-            return domain
-        except Exception:
-            return ""
+        return extract_domain(url)
 
     def is_configured(self) -> bool:
         """Check if Serper API key is configured."""
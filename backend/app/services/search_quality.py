@@ -1,26 +1,45 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
-from urllib.parse import urlparse
-
+from functools import lru_cache
+from datetime import datetime, timedelta, UTC
+from typing import AbstractSet, Any
+from collections.abc import Iterable, Sequence
 
 _TOKEN_RE = re.compile(r"[a-z0-9]{2,}")
 _RELATIVE_TIME_RE = re.compile(
     r"(?P<count>\d+)\s+(?P<unit>minute|hour|day|week|month|year)s?\s+ago",
     re.IGNORECASE,
 )
+# One unit of each relative age; months and years are approximated.
+_RELATIVE_UNITS = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+    "year": timedelta(days=365),
+}
+# Host part of a URL or bare domain: optional scheme and "www.", then
+# everything up to the first path, query or fragment delimiter.
+_DOMAIN_RE = re.compile(
+    r"^(?:[a-z][a-z0-9+\-.]*://)?(?:www\.)?([^/?#]*)", re.IGNORECASE
+)
+_URL_KEY_RE = re.compile(
+    r"^(?:[a-z][a-z0-9+\-.]*://)?(?:www\.)?([^/?#]*)([^?#]*)", re.IGNORECASE
+)
 
 
-def parse_domain_list(raw: str) -> Set[str]:
+def parse_domain_list(raw: str) -> frozenset[str]:
+    # Frozen: the lists are fixed after startup and double as cache keys in
+    # domain_allowed.
     if not raw or not isinstance(raw, str):
-        return set()
-    return {
+        return frozenset()
+    return frozenset(
         entry.strip().lower().removeprefix("www.")
         for entry in raw.split(",")
         if entry.strip()
-    }
+    )
 
 
 def coerce_float(value: Any, default: float) -> float:
@@ -33,65 +52,66 @@ def coerce_float(value: Any, default: float) -> float:
 def extract_domain(value: str) -> str:
     if not value:
         return ""
-    domain = value.strip().lower()
-    if "://" in domain:
-        parsed = urlparse(domain)
-        domain = parsed.netloc.lower()
-    return domain.removeprefix("www.")
+    # A single anchored match is much cheaper than building a ParseResult.
+    return _DOMAIN_RE.match(value.strip()).group(1).lower()
 
 
 def normalize_url(url: str) -> str:
     if not url:
         return ""
-    parsed = urlparse(url.strip())
-    normalized_netloc = parsed.netloc.lower().removeprefix("www.")
-    normalized_path = parsed.path.rstrip("/")
-    return f"{normalized_netloc}{normalized_path}"
-
-
-def parse_date_string(
-    value: Optional[str], now: Optional[datetime] = None
-) -> Optional[datetime]:
-    if not value:
-        return None
+    # Host (lowercased, without "www.") plus path, minus query and fragment.
+    match = _URL_KEY_RE.match(url.strip())
+    return match.group(1).lower() + match.group(2).rstrip("/")
 
-    now = now or datetime.now(timezone.utc)
-    raw = value.strip()
 
+@lru_cache(maxsize=1024)
+def _parse_absolute_date(raw: str) -> datetime | None:
+    # Independent of "now", so safe to memoize: providers repeat the same
+    # timestamp strings across results and searches. 3.11+ fromisoformat
+    # parses a trailing "Z" itself.
     try:
-        return datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        return datetime.fromisoformat(raw)
     except ValueError:
         pass
 
-    relative_match = _RELATIVE_TIME_RE.search(raw)
-    if relative_match:
-        count = int(relative_match.group("count"))
-        unit = relative_match.group("unit").lower()
-        if unit == "minute":
-            return now - timedelta(minutes=count)
-        if unit == "hour":
-            return now - timedelta(hours=count)
-        if unit == "day":
-            return now - timedelta(days=count)
-        if unit == "week":
-            return now - timedelta(weeks=count)
-        if unit == "month":
-            return now - timedelta(days=count * 30)
-        if unit == "year":
-            return now - timedelta(days=count * 365)
-
     for fmt in ("%b %d, %Y", "%B %d, %Y", "%Y-%m-%d"):
         try:
             parsed = datetime.strptime(raw, fmt)
-            return parsed.replace(tzinfo=timezone.utc)
+            return parsed.replace(tzinfo=UTC)
         except ValueError:
             continue
+    return None
+
+
+def parse_date_string(
+    value: str | None, now: datetime | None = None
+) -> datetime | None:
+    if not value:
+        return None
+
+    raw = value.strip()
+    parsed = _parse_absolute_date(raw)
+    if parsed is not None:
+        return parsed
+
+    relative_match = _RELATIVE_TIME_RE.search(raw)
+    if relative_match:
+        now = now or datetime.now(UTC)
+        count = int(relative_match.group("count"))
+        return now - count * _RELATIVE_UNITS[relative_match.group("unit").lower()]
 
     return None
 
 
-def tokenize(text: str) -> Set[str]:
-    return set(_TOKEN_RE.findall((text or "").lower()))
+@lru_cache(maxsize=4096)
+def _tokenize_cached(text: str) -> frozenset[str]:
+    return frozenset(_TOKEN_RE.findall(text))
+
+
+def tokenize(text: str) -> frozenset[str]:
+    # Ranking tokenizes the same titles and snippets for filtering and
+    # scoring, and repeat searches see the same headlines; memoize the scan.
+    return _tokenize_cached((text or "").lower())
 
 
 class SearchQualityConfig:
@@ -127,7 +147,18 @@ class SearchQualityConfig:
         }
 
 
-def domain_allowed(domain: str, allowlist: Set[str], blocklist: Set[str]) -> bool:
+def domain_allowed(
+    domain: str, allowlist: AbstractSet[str], blocklist: AbstractSet[str]
+) -> bool:
+    # frozenset() returns a frozenset argument unchanged, so the configured
+    # lists key the cache without copying and their hashes are computed once.
+    return _domain_verdict(domain, frozenset(allowlist), frozenset(blocklist))
+
+
+@lru_cache(maxsize=2048)
+def _domain_verdict(
+    domain: str, allowlist: frozenset[str], blocklist: frozenset[str]
+) -> bool:
     normalized = extract_domain(domain)
     if not normalized:
         return False
@@ -138,60 +169,73 @@ def domain_allowed(domain: str, allowlist: Set[str], blocklist: Set[str]) -> boo
     return True
 
 
-def dedupe_records(records: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    deduped: List[Dict[str, Any]] = []
-    seen: Set[str] = set()
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC so mixed sources compare safely."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def dedupe_records(records: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+    # Keyed on normalize_url, so scheme, "www.", tracking query strings and
+    # fragments don't make copies of one story look distinct. A newer copy
+    # replaces an older one in place, keeping first-seen order.
+    deduped: dict[str, dict[str, Any]] = {}
     for record in records:
         key = normalize_url(record.get("url", "")) or record.get("title", "").strip()
-        if not key or key in seen:
+        if not key:
             continue
-        seen.add(key)
-        deduped.append(record)
-    return deduped
+        current = deduped.get(key)
+        if current is None:
+            deduped[key] = record
+            continue
+        published = record.get("published")
+        current_published = current.get("published")
+        if published and (
+            not current_published or _as_utc(published) > _as_utc(current_published)
+        ):
+            deduped[key] = record
+    return list(deduped.values())
 
 
 def apply_recency_window(
-    records: Iterable[Dict[str, Any]], days_back: int, date_key: str = "published"
-) -> List[Dict[str, Any]]:
+    records: Iterable[dict[str, Any]],
+    days_back: int,
+    date_key: str = "published",
+    now: datetime | None = None,
+) -> list[dict[str, Any]]:
     if days_back <= 0:
         return list(records)
 
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
-    filtered: List[Dict[str, Any]] = []
+    cutoff = (now or datetime.now(UTC)) - timedelta(days=days_back)
+    filtered: list[dict[str, Any]] = []
     for record in records:
         published = record.get(date_key)
         if not published:
             filtered.append(record)
             continue
         if published.tzinfo is None:
-            published = published.replace(tzinfo=timezone.utc)
+            published = published.replace(tzinfo=UTC)
         if published >= cutoff:
             filtered.append(record)
     return filtered
 
 
-def _recency_score(published: Optional[datetime], max_days: int) -> float:
+def _recency_score(published: datetime | None, max_days: int, now: datetime) -> float:
     if not published:
         return 0.12
-    published_utc = (
-        published.replace(tzinfo=timezone.utc)
-        if published.tzinfo is None
-        else published.astimezone(timezone.utc)
-    )
-    age_days = max(
-        0.0, (datetime.now(timezone.utc) - published_utc).total_seconds() / 86400.0
-    )
+    age_days = max(0.0, (now - _as_utc(published)).total_seconds() / 86400.0)
     if age_days >= max_days:
         return 0.0
     return max(0.0, 1.0 - (age_days / max_days))
 
 
 def score_record(
-    record: Dict[str, Any],
+    record: dict[str, Any],
     *,
-    topic_tokens: Set[str],
+    topic_tokens: set[str],
     topic_text: str,
-    trusted_domains: Set[str],
+    trusted_domains: set[str],
     recency_days: int,
     strict_quality_mode: bool,
     relevance_weight: float = 0.60,
@@ -199,18 +243,22 @@ def score_record(
     snippet_weight: float = 0.10,
     domain_weight: float = 0.10,
     strict_no_overlap_penalty: float = 0.35,
+    text_tokens: frozenset[str] | None = None,
+    now: datetime | None = None,
+    topic_lower: str | None = None,
 ) -> float:
     title = record.get("title", "")
     snippet = record.get("snippet", "") or record.get("summary", "")
     domain = extract_domain(record.get("source") or record.get("url", ""))
     published = record.get("published")
 
-    text_tokens = tokenize(f"{title} {snippet}")
+    if text_tokens is None:
+        text_tokens = tokenize(f"{title} {snippet}")
     overlap = len(topic_tokens & text_tokens)
     relevance_score = min(1.0, overlap / max(1, min(len(topic_tokens), 6)))
-    title_l = title.lower()
-    topic_l = (topic_text or "").strip().lower()
-    exact_phrase_boost = 0.08 if topic_l and topic_l in title_l else 0.0
+    if topic_lower is None:
+        topic_lower = (topic_text or "").strip().lower()
+    exact_phrase_boost = 0.08 if topic_lower and topic_lower in title.lower() else 0.0
 
     snippet_len = len(snippet.strip())
     snippet_quality = 0.0
@@ -220,7 +268,9 @@ def score_record(
         snippet_quality = 1.0
 
     domain_quality = 0.35 if domain in trusted_domains else 0.15
-    recency_score = _recency_score(published, max(7, recency_days))
+    recency_score = _recency_score(
+        published, max(7, recency_days), now or datetime.now(UTC)
+    )
 
     total = (
         (relevance_score * relevance_weight)
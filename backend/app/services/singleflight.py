@@ -0,0 +1,46 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Collapse concurrent calls sharing a key into a single in-flight call."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, _Flight] = {}
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        flight = self._inflight.get(key)
+        if flight is None:
+            # The shared call runs in its own task so no single caller owns it;
+            # cancelling the first caller must not cancel everyone waiting.
+            flight = _Flight(asyncio.ensure_future(factory()))
+            self._inflight[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                # Nobody is left to use the result, so stop the upstream call.
+                self._forget(key, flight)
+                flight.task.cancel()
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+
+    def __len__(self) -> int:
+        return len(self._inflight)
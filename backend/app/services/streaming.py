@@ -0,0 +1,87 @@
+import asyncio
+from collections.abc import AsyncIterator
+from json.encoder import encode_basestring
+
+from pydantic import BaseModel
+
+
+def event_frame(event: BaseModel) -> str:
+    """Encode a stream event model as an SSE ``data:`` frame."""
+    return f"data: {event.model_dump_json()}\n\n"
+
+
+def token_frame(text: str) -> str:
+    """
+    Encode a ``TokenEvent`` SSE frame without building the pydantic model.
+
+    Token frames are the bulk of a stream; the output matches
+    ``TokenEvent(text=text).model_dump_json()``.
+    """
+    # encode_basestring is what json.dumps(..., ensure_ascii=False) calls for a
+    # str, minus building a JSONEncoder per call for the non-default option.
+    return f'data: {{"type":"token","text":{encode_basestring(text)}}}\n\n'
+
+
+async def coalesce_tokens(
+    tokens: AsyncIterator[str], window_seconds: float
+) -> AsyncIterator[str]:
+    """
+    Merge tokens that arrive within ``window_seconds`` of each other.
+
+    The first token is yielded immediately so time-to-first-token is unchanged;
+    later tokens are buffered and flushed once the window elapses, cutting the
+    number of SSE frames sent for fast streams.
+
+    Args:
+        tokens: Upstream token stream
+        window_seconds: Max time a token waits in the buffer; ``<= 0`` disables
+
+    Yields:
+        Token chunks whose concatenation equals the upstream stream
+    """
+    if window_seconds <= 0:
+        async for token in tokens:
+            yield token
+        return
+
+    loop = asyncio.get_running_loop()
+    iterator = aiter(tokens)
+    buffer: list[str] = []
+    deadline = 0.0
+    first = True
+    pending: asyncio.Future | None = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(iterator))
+            timeout = max(0.0, deadline - loop.time()) if buffer else None
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if not done:
+                # Upstream went quiet: flush what we have without cancelling it.
+                yield "".join(buffer)
+                buffer.clear()
+                continue
+
+            task, pending = pending, None
+            try:
+                token = task.result()
+            except StopAsyncIteration:
+                break
+
+            if first:
+                first = False
+                yield token
+                continue
+
+            buffer.append(token)
+            if len(buffer) == 1:
+                deadline = loop.time() + window_seconds
+            elif loop.time() >= deadline:
+                yield "".join(buffer)
+                buffer.clear()
+
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        if pending is not None:
+            pending.cancel()
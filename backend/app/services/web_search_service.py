@@ -1,6 +1,11 @@
-from typing import List, Dict, Any, Optional
+import heapq
+from datetime import datetime, UTC
+from functools import partial
+from operator import itemgetter
+from typing import Any
 import logging
 from app.core.config import settings
+from app.services.response_cache import ResponseCache, normalize_topic
 from app.services.search_providers import (
     SearchProvider,
     BraveSearchProvider,
@@ -14,6 +19,7 @@ from app.services.search_quality import (
     score_record,
     tokenize,
 )
+from app.services.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +27,7 @@ logger = logging.getLogger(__name__)
 class WebSearchService:
     """Service for web search using configurable search providers."""
 
-    def __init__(self, provider_name: Optional[str] = None):
+    def __init__(self, provider_name: str | None = None):
         """
         Initialize web search service with a specific provider.
 
@@ -38,7 +44,9 @@ class WebSearchService:
         if provider_name:
             if provider_name not in self.providers:
                 logger.warning(
-                    f"Provider '{provider_name}' not found. Available: {list(self.providers.keys())}"
+                    "Provider '%s' not found. Available: %s",
+                    provider_name,
+                    list(self.providers),
                 )
                 self.provider = None
             else:
@@ -48,7 +56,7 @@ class WebSearchService:
             self.provider = self._get_first_configured_provider()
 
         if self.provider:
-            logger.info(f"Using search provider: {self.provider.name}")
+            logger.info("Using search provider: %s", self.provider.name)
         else:
             logger.warning("No search provider configured")
 
@@ -57,8 +65,14 @@ class WebSearchService:
         self.blocklist = self._quality.blocklist
         self.trusted_domains = self._quality.trusted_domains
         self.score_weights = self._quality.score_weights
+        # Repeat searches for a trending topic reuse one provider round trip.
+        self.results_cache = ResponseCache(
+            max_entries=settings.web_cache_max_entries,
+            ttl_seconds=settings.web_cache_ttl_seconds,
+        )
+        self.inflight = SingleFlight()
 
-    def _get_first_configured_provider(self) -> Optional[SearchProvider]:
+    def _get_first_configured_provider(self) -> SearchProvider | None:
         """Get the first configured provider."""
         for provider in self.providers.values():
             if provider.is_configured():
@@ -70,7 +84,7 @@ class WebSearchService:
         query: str,
         max_results: int = 5,
         strict_quality_mode: bool = False,
-    ) -> List[Dict[str, Any]]:
+    ) -> list[dict[str, Any]]:
         """
         Search the web for the given query.
 
@@ -91,32 +105,53 @@ class WebSearchService:
             return []
 
         if not self.provider.is_configured():
-            logger.warning(f"Provider {self.provider.name} is not configured")
+            logger.warning("Provider %s is not configured", self.provider.name)
             return []
 
+        cache_key = (
+            f"{self.provider.name}|{normalize_topic(query)}|{max_results}"
+            f"|{strict_quality_mode}"
+        )
+        cached = self.results_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         try:
-            fetch_count = min(20, max_results * (3 if strict_quality_mode else 2))
-            results = await self.provider.search(query, fetch_count)
-            return self._rank_and_filter_results(
-                query=query,
-                results=results,
-                max_results=max_results,
-                strict_quality_mode=strict_quality_mode,
+            results = await self.inflight.do(
+                cache_key,
+                partial(self._search_and_rank, query, max_results, strict_quality_mode),
             )
         except Exception as e:
-            logger.error(f"Search failed with provider {self.provider.name}: {e}")
+            logger.error("Search failed with provider %s: %s", self.provider.name, e)
             return []
+        # Providers swallow their own errors as []; don't pin those.
+        if results:
+            self.results_cache.set(cache_key, results)
+        return list(results)
+
+    async def _search_and_rank(
+        self, query: str, max_results: int, strict_quality_mode: bool
+    ) -> list[dict[str, Any]]:
+        fetch_count = min(20, max_results * (3 if strict_quality_mode else 2))
+        results = await self.provider.search(query, fetch_count)
+        return self._rank_and_filter_results(
+            query=query,
+            results=results,
+            max_results=max_results,
+            strict_quality_mode=strict_quality_mode,
+        )
 
     def _rank_and_filter_results(
         self,
         *,
         query: str,
-        results: List[Dict[str, Any]],
+        results: list[dict[str, Any]],
         max_results: int,
         strict_quality_mode: bool,
-    ) -> List[Dict[str, Any]]:
+    ) -> list[dict[str, Any]]:
         topic_tokens = tokenize(query)
-        filtered: List[Dict[str, Any]] = []
+        topic_lower = query.strip().lower()
+        filtered: list[dict[str, Any]] = []
 
         for result in results:
             title = (result.get("title") or "").strip()
@@ -129,41 +164,54 @@ class WebSearchService:
                 continue
             result["source"] = domain
 
-            if strict_quality_mode:
-                snippet = (result.get("snippet") or "").strip()
-                overlap = len(topic_tokens & tokenize(f"{title} {snippet}"))
-                if len(snippet) < 80 or overlap == 0:
-                    continue
+            snippet = (result.get("snippet") or "").strip()
+            # Tokenized once here and reused by score_record below.
+            text_tokens = tokenize(f"{title} {snippet}")
+            # Only emptiness matters here; isdisjoint stops at the first shared
+            # token and builds no intersection set.
+            if strict_quality_mode and (
+                len(snippet) < 80 or topic_tokens.isdisjoint(text_tokens)
+            ):
+                continue
 
+            result["_text_tokens"] = text_tokens
             filtered.append(result)
 
         deduped = dedupe_records(filtered)
+        now = datetime.now(UTC)
+        # Scores live beside the records rather than on them, so nothing has
+        # to be popped afterwards; the key is computed once per candidate.
+        scored = []
         for item in deduped:
-            item["_quality_score"] = score_record(
+            score = score_record(
                 item,
                 topic_tokens=topic_tokens,
                 topic_text=query,
                 trusted_domains=self.trusted_domains,
                 recency_days=30,
                 strict_quality_mode=strict_quality_mode,
+                text_tokens=item.get("_text_tokens"),
+                now=now,
+                topic_lower=topic_lower,
                 **self.score_weights,
             )
+            scored.append(((score, bool(item.get("published"))), item))
 
-        ranked = sorted(
-            deduped,
-            key=lambda r: (r.get("_quality_score", 0.0), bool(r.get("published"))),
-            reverse=True,
-        )
-        final_results = ranked[:max_results]
+        # Top-k selection; only max_results of the candidates are kept.
+        final_results = [
+            item for _, item in heapq.nlargest(max_results, scored, key=itemgetter(0))
+        ]
         for item in final_results:
-            item.pop("_quality_score", None)
+            item.pop("_text_tokens", None)
         return final_results
 
-    def format_search_context(self, results: List[Dict[str, Any]]) -> str:
-        """Format search results into a context string for the LLM."""
+    def format_search_context(self, results: list[dict[str, Any]]) -> str | None:
+        """Format search results into a context string for the LLM, or None."""
         if not results:
-            return "No web search results found for this topic."
+            return None
 
+        # Collect fragments and join once rather than growing a string per
+        # article.
         context_parts = ["Web search results:"]
 
         for i, result in enumerate(results, 1):
@@ -177,32 +225,30 @@ class WebSearchService:
             if len(snippet) > 200:
                 snippet = snippet[:197] + "..."
 
-            result_text = f"\n{i}. {title}"
+            context_parts.append(f"\n\n{i}. {title}")
             if source:
-                result_text += f" ({source})"
+                context_parts.append(f" ({source})")
             if published:
-                result_text += f" - {published.strftime('%Y-%m-%d')}"
+                context_parts.append(f" - {published.date().isoformat()}")
             if snippet:
-                result_text += f"\n   {snippet}"
+                context_parts.append(f"\n   {snippet}")
             if url:
-                result_text += f"\n   URL: {url}"
-
-            context_parts.append(result_text)
+                context_parts.append(f"\n   URL: {url}")
 
-        return "\n".join(context_parts)
+        return "".join(context_parts)
 
     async def search_and_format(
         self, query: str, max_results: int = 5, strict_quality_mode: bool = False
-    ) -> str:
-        """Search the web and return formatted context string."""
+    ) -> str | None:
+        """Search the web and return formatted context, or None if no results."""
         results = await self.search(query, max_results, strict_quality_mode)
         return self.format_search_context(results)
 
-    def get_available_providers(self) -> List[str]:
+    def get_available_providers(self) -> list[str]:
         """Get list of available provider names."""
         return list(self.providers.keys())
 
-    def get_configured_providers(self) -> List[str]:
+    def get_configured_providers(self) -> list[str]:
         """Get list of configured provider names."""
         return [
             name
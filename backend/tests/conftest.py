@@ -2,7 +2,9 @@ import pytest
 import asyncio
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock
-from app.main import app
+from app.agents import anthropic_agent, openai_agent
+from app.main import app, request_timestamps_by_ip
+from app.services.search_providers import http_client as search_http_client
 from app.core.config import settings
 
 
@@ -13,6 +15,26 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_llm_clients():
+    # Agents and search providers share cached clients; clear them so client
+    # patches take effect.
+    openai_agent._get_client.cache_clear()
+    anthropic_agent._get_client.cache_clear()
+    search_http_client.get_search_client.cache_clear()
+    yield
+    openai_agent._get_client.cache_clear()
+    anthropic_agent._get_client.cache_clear()
+    search_http_client.get_search_client.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    # The in-memory limiter is process-global; start every test with a clean slate.
+    request_timestamps_by_ip.clear()
+    yield
+
+
 @pytest.fixture
 def client():
     with TestClient(app) as c:
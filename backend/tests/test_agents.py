@@ -1,8 +1,17 @@
 import pytest
+import asyncio
+import anthropic
+import httpx
+import openai
 from unittest.mock import AsyncMock, patch, MagicMock
 from app.agents.base import BaseAgent
 from app.agents.openai_agent import OpenAIAgent
 from app.agents.anthropic_agent import AnthropicAgent
+from tests.utils import (
+    async_iterate,
+    create_mock_anthropic_stream,
+    create_mock_openai_chunk,
+)
 
 
 class TestBaseAgent:
@@ -58,6 +67,25 @@ class TestOpenAIAgent:
         assert agent.model == "gpt-4"
         assert agent.temperature == 0.5
 
+    def test_agents_share_one_client(self, mock_settings):
+        assert OpenAIAgent().client is OpenAIAgent("Other", "gpt-4").client
+
+    def test_client_is_built_on_first_use(self, mock_settings):
+        from app.agents.openai_agent import _get_client
+
+        agent = OpenAIAgent()
+        assert _get_client.cache_info().currsize == 0
+        assert agent.client is _get_client()
+
+    @pytest.mark.asyncio
+    async def test_warmup_rebinds_client_after_close(self, mock_settings):
+        agent = OpenAIAgent()
+        closed_client = agent.client
+        await agent.aclose()
+        await agent.warmup()
+        assert agent.client is not closed_client
+        assert not agent.client.is_closed()
+
     def test_get_system_prompt_controversial(self, mock_settings):
         agent = OpenAIAgent()
         prompt = agent.get_system_prompt("controversial")
@@ -75,28 +103,126 @@ class TestOpenAIAgent:
         controversial_prompt = agent.get_system_prompt("controversial")
         assert prompt == controversial_prompt
 
+    def test_format_prompt_with_news(self, mock_settings):
+        agent = OpenAIAgent()
+        prompt = agent.format_prompt_with_news("{curly} topic", "Headline {1}")
+        assert prompt.startswith("Topic: <topic>{curly} topic</topic>")
+        assert "Recent news context:\nHeadline {1}\n" in prompt
+        assert prompt.endswith(
+            "no labels, headers, style names, or alternative versions."
+        )
+
+    def test_format_prompt_without_news(self, mock_settings):
+        agent = OpenAIAgent()
+        prompt = agent.format_prompt_with_news("pizza", None)
+        assert prompt.startswith(
+            "Generate a single hot take about the following topic: <topic>pizza</topic>."
+        )
+        assert "Recent news context" not in prompt
+
     @pytest.mark.asyncio
     @patch("app.agents.openai_agent.AsyncOpenAI")
     async def test_generate_hot_take_success(self, mock_openai_class, mock_settings):
         mock_client = AsyncMock()
         mock_openai_class.return_value = mock_client
 
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "  AI will dominate the world!  "
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create.return_value = async_iterate(
+            create_mock_openai_chunk("  AI will "),
+            create_mock_openai_chunk(None),
+            create_mock_openai_chunk("dominate!  "),
+        )
 
         agent = OpenAIAgent()
         result = await agent.generate_hot_take(
             "artificial intelligence", "controversial"
         )
 
-        assert result == "AI will dominate the world!"
+        assert result == "AI will dominate!"
         mock_client.chat.completions.create.assert_called_once()
         call_args = mock_client.chat.completions.create.call_args
         assert call_args.kwargs["model"] == "gpt-4.1-mini"
         assert call_args.kwargs["temperature"] == 0.8
         assert call_args.kwargs["max_tokens"] == 200
+        assert call_args.kwargs["stream"] is True
+
+    @pytest.mark.asyncio
+    @patch("app.agents.openai_agent.AsyncOpenAI")
+    async def test_generate_hot_take_skips_leading_whitespace_chunks(
+        self, mock_openai_class, mock_settings
+    ):
+        mock_client = AsyncMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.return_value = async_iterate(
+            create_mock_openai_chunk("\n"),
+            create_mock_openai_chunk("  "),
+            create_mock_openai_chunk(" Hot  take "),
+            create_mock_openai_chunk("\n"),
+        )
+
+        agent = OpenAIAgent()
+        result = await agent.generate_hot_take("test topic")
+
+        assert result == "Hot  take"
+
+    @pytest.mark.asyncio
+    @patch("app.agents.openai_agent.AsyncOpenAI")
+    async def test_generate_hot_take_idle_timeout(
+        self, mock_openai_class, mock_settings
+    ):
+        async def stalled_stream():
+            yield create_mock_openai_chunk("Hot ")
+            await asyncio.sleep(1)
+            yield create_mock_openai_chunk("take")
+
+        mock_client = AsyncMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.return_value = stalled_stream()
+
+        agent = OpenAIAgent()
+        agent.stream_idle_timeout = 0.01
+        with pytest.raises(RuntimeError, match="OpenAI generation failed"):
+            await agent.generate_hot_take("test topic")
+
+    @pytest.mark.asyncio
+    @patch("app.agents.openai_agent.AsyncOpenAI")
+    async def test_generate_hot_take_idle_timeout_closes_stream(
+        self, mock_openai_class, mock_settings
+    ):
+        class StalledStream:
+            closed = False
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                await asyncio.sleep(1)
+
+            async def close(self):
+                self.closed = True
+
+        stream = StalledStream()
+        mock_client = AsyncMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.return_value = stream
+
+        agent = OpenAIAgent()
+        agent.stream_idle_timeout = 0.01
+        with pytest.raises(RuntimeError, match="OpenAI generation failed"):
+            await agent.generate_hot_take("test topic")
+
+        assert stream.closed
+
+    @pytest.mark.asyncio
+    async def test_generate_hot_takes_fans_out_for_distinct_prompts(
+        self, mock_settings
+    ):
+        agent = OpenAIAgent()
+        agent.generate_hot_take = AsyncMock(side_effect=["Witty", "Absurd"])
+
+        result = await agent.generate_hot_takes("pizza", ["witty", "absurd"])
+
+        assert result == ["Witty", "Absurd"]
+        assert agent.generate_hot_take.call_count == 2
 
     @pytest.mark.asyncio
     @patch("app.agents.openai_agent.AsyncOpenAI")
@@ -109,6 +235,56 @@ class TestOpenAIAgent:
         with pytest.raises(RuntimeError, match="OpenAI generation failed"):
             await agent.generate_hot_take("test topic")
 
+    @pytest.mark.asyncio
+    @patch("app.agents.openai_agent.AsyncOpenAI")
+    async def test_generate_hot_take_retries_transient_errors(
+        self, mock_openai_class, mock_settings
+    ):
+        mock_client = AsyncMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.side_effect = [
+            openai.APIConnectionError(request=httpx.Request("POST", "https://x")),
+            async_iterate(create_mock_openai_chunk("Recovered take")),
+        ]
+
+        agent = OpenAIAgent()
+        agent.retry_initial_delay = 0
+        result = await agent.generate_hot_take("test topic")
+
+        assert result == "Recovered take"
+        assert mock_client.chat.completions.create.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("app.agents.openai_agent.AsyncOpenAI")
+    async def test_generate_hot_take_gives_up_after_max_attempts(
+        self, mock_openai_class, mock_settings
+    ):
+        mock_client = AsyncMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.side_effect = openai.APITimeoutError(
+            request=httpx.Request("POST", "https://x")
+        )
+
+        agent = OpenAIAgent()
+        agent.retry_initial_delay = 0
+        with pytest.raises(RuntimeError, match="OpenAI generation failed"):
+            await agent.generate_hot_take("test topic")
+        assert mock_client.chat.completions.create.call_count == agent.max_attempts
+
+    @pytest.mark.asyncio
+    @patch("app.agents.openai_agent.AsyncOpenAI")
+    async def test_generate_hot_take_does_not_retry_other_errors(
+        self, mock_openai_class, mock_settings
+    ):
+        mock_client = AsyncMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.side_effect = ValueError("bad request")
+
+        agent = OpenAIAgent()
+        with pytest.raises(RuntimeError, match="OpenAI generation failed"):
+            await agent.generate_hot_take("test topic")
+        mock_client.chat.completions.create.assert_called_once()
+
 
 class TestAnthropicAgent:
     def test_anthropic_agent_initialization(self, mock_settings):
@@ -123,6 +299,9 @@ class TestAnthropicAgent:
         assert agent.model == "claude-3-sonnet-20240229"
         assert agent.temperature == 0.6
 
+    def test_agents_share_one_client(self, mock_settings):
+        assert AnthropicAgent().client is AnthropicAgent().client
+
     def test_get_system_prompt_analytical(self, mock_settings):
         agent = AnthropicAgent()
         prompt = agent.get_system_prompt("analytical")
@@ -146,20 +325,24 @@ class TestAnthropicAgent:
         mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
 
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock()]
-        mock_response.content[0].text = "  Climate change is overrated!  "
-        mock_client.messages.create.return_value = mock_response
+        mock_client.messages.stream = MagicMock(
+            return_value=create_mock_anthropic_stream(
+                "  Climate change ", "is overrated!  "
+            )
+        )
 
         agent = AnthropicAgent()
         result = await agent.generate_hot_take("climate change", "contrarian")
 
         assert result == "Climate change is overrated!"
-        mock_client.messages.create.assert_called_once()
-        call_args = mock_client.messages.create.call_args
+        mock_client.messages.stream.assert_called_once()
+        call_args = mock_client.messages.stream.call_args
         assert call_args.kwargs["model"] == "claude-haiku-4-5-20251001"
         assert call_args.kwargs["temperature"] == 0.8
         assert call_args.kwargs["max_tokens"] == 200
+        system_blocks = call_args.kwargs["system"]
+        assert system_blocks[0]["text"] == agent.get_system_prompt("contrarian")
+        assert system_blocks[0]["cache_control"] == {"type": "ephemeral"}
 
     @pytest.mark.asyncio
     @patch("app.agents.anthropic_agent.AsyncAnthropic")
@@ -168,12 +351,37 @@ class TestAnthropicAgent:
     ):
         mock_client = AsyncMock()
         mock_anthropic_class.return_value = mock_client
-        mock_client.messages.create.side_effect = Exception("Anthropic API Error")
+        mock_client.messages.stream = MagicMock(
+            side_effect=Exception("Anthropic API Error")
+        )
 
         agent = AnthropicAgent()
         with pytest.raises(RuntimeError, match="Anthropic generation failed"):
             await agent.generate_hot_take("test topic")
 
+    @pytest.mark.asyncio
+    @patch("app.agents.anthropic_agent.AsyncAnthropic")
+    async def test_generate_hot_take_retries_transient_errors(
+        self, mock_anthropic_class, mock_settings
+    ):
+        mock_client = AsyncMock()
+        mock_anthropic_class.return_value = mock_client
+        mock_client.messages.stream = MagicMock(
+            side_effect=[
+                anthropic.APIConnectionError(
+                    request=httpx.Request("POST", "https://x")
+                ),
+                create_mock_anthropic_stream("Recovered take"),
+            ]
+        )
+
+        agent = AnthropicAgent()
+        agent.retry_initial_delay = 0
+        result = await agent.generate_hot_take("test topic")
+
+        assert result == "Recovered take"
+        assert mock_client.messages.stream.call_count == 2
+
 
 class TestAgentIntegration:
     @pytest.mark.external
@@ -1,5 +1,8 @@
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 from fastapi import status
+from fastapi.testclient import TestClient
+import app.main as main_module
+from app.main import app
 from app.models.schemas import HotTakeResponse
 
 
@@ -58,6 +61,18 @@ class TestMainEndpoints:
         assert len(data["missing_configuration"]) > 0
         assert any("AI provider" in msg for msg in data["missing_configuration"])
 
+    @patch("app.main.hot_take_service")
+    def test_lifespan_warms_up_and_closes_service(self, mock_service):
+        mock_service.warmup = AsyncMock()
+        mock_service.aclose = AsyncMock()
+        mock_service.keep_alive = AsyncMock()
+
+        with TestClient(app):
+            mock_service.warmup.assert_awaited_once()
+            mock_service.aclose.assert_not_awaited()
+        mock_service.aclose.assert_awaited_once()
+        mock_service.keep_alive.assert_called_once()
+
 
 class TestHotTakeEndpoints:
     def test_get_agents(self, client):
@@ -110,6 +125,19 @@ class TestHotTakeEndpoints:
         assert data["style"] == sample_hot_take_response["style"]
         assert data["agent_used"] == sample_hot_take_response["agent_used"]
 
+    @patch("app.api.routes.hot_take_service.generate_hot_take")
+    def test_generate_hot_take_body_matches_response_model(
+        self, mock_generate, client, sample_hot_take_request, sample_hot_take_response
+    ):
+        result = HotTakeResponse(**sample_hot_take_response)
+        mock_generate.return_value = result
+
+        response = client.post("/api/generate", json=sample_hot_take_request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == result.model_dump(mode="json")
+
     def test_generate_hot_take_missing_topic(self, client):
         invalid_request = {"style": "controversial"}
         response = client.post("/api/generate", json=invalid_request)
@@ -184,6 +212,34 @@ class TestHotTakeEndpoints:
             == "Failed to generate hot take. Please try again."
         )
 
+    @patch("app.services.hot_take_service.HotTakeService.generate_hot_takes")
+    def test_generate_hot_takes_batch(self, mock_generate_batch, client):
+        mock_generate_batch.return_value = [
+            HotTakeResponse(
+                hot_take=f"{style} take",
+                topic="ai",
+                style=style,
+                agent_used="Test Agent",
+            )
+            for style in ["witty", "sarcastic"]
+        ]
+
+        response = client.post(
+            "/api/generate/batch",
+            json={"topic": "ai", "styles": ["witty", "sarcastic"]},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        hot_takes = response.json()["hot_takes"]
+        assert [take["style"] for take in hot_takes] == ["witty", "sarcastic"]
+        assert mock_generate_batch.call_args.kwargs["styles"] == ["witty", "sarcastic"]
+
+    def test_generate_hot_takes_batch_rejects_empty_styles(self, client):
+        response = client.post(
+            "/api/generate/batch", json={"topic": "ai", "styles": []}
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
 
 class TestCORSHeaders:
     def test_cors_headers_present(self, client):
@@ -194,6 +250,25 @@ class TestCORSHeaders:
         # Check for CORS headers in response
         assert "access-control-allow-origin" in response.headers
 
+    def test_cors_headers_present_on_payload_too_large(self, client):
+        headers = {"Origin": "http://localhost:5173"}
+        response = client.post(
+            "/api/generate", json={"topic": "x" * 20000}, headers=headers
+        )
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert (
+            response.headers["access-control-allow-origin"] == "http://localhost:5173"
+        )
+
+    def test_cors_headers_present_on_rate_limit(self, client, monkeypatch):
+        monkeypatch.setattr(main_module, "_RATE_LIMIT_PER_MINUTE", 0)
+        headers = {"Origin": "http://localhost:5173"}
+        response = client.post("/api/generate", json={"topic": "ai"}, headers=headers)
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert (
+            response.headers["access-control-allow-origin"] == "http://localhost:5173"
+        )
+
     def test_cors_headers_not_present_for_disallowed_origin(self, client):
         headers = {"Origin": "http://evil.example"}
         response = client.get("/api/agents", headers=headers)
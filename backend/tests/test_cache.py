@@ -1,9 +1,11 @@
 import json
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.core.config import settings
 from app.services.cache import CacheService
+from app.services.response_cache import ResponseCache
 
 
 @pytest.mark.asyncio
@@ -11,73 +13,143 @@ async def test_cache_returns_none_when_client_missing():
     service = CacheService()
     service._client = None
 
-    value, pool_size = await service.get_random_variant("ai", "witty", "openai")
+    value, pool_size = await service.get_random_payload("ai", "witty", "openai")
 
     assert value is None
     assert pool_size == 0
 
 
 @pytest.mark.asyncio
-async def test_cache_get_random_variant_from_legacy_single_value():
+async def test_cache_get_random_payload_picks_one_list_entry():
     service = CacheService()
     service._client = AsyncMock()
-    service._client.get.return_value = json.dumps(
-        {
-            "hot_take": "Legacy entry",
-            "topic": "ai",
-            "style": "witty",
-            "agent_used": "OpenAI Agent",
-        }
-    )
+    payloads = [
+        json.dumps({"hot_take": "Take one", "style": "witty"}),
+        json.dumps({"hot_take": "Take two", "style": "witty"}),
+    ]
+    service._client.lrange.return_value = payloads
 
     with patch(
         "app.services.cache.random.choice",
-        side_effect=lambda values: values[0],
+        side_effect=lambda values: values[1],
     ):
-        value, pool_size = await service.get_random_variant("ai", "witty", "openai")
+        value, pool_size = await service.get_random_payload("ai", "witty", "openai")
 
-    assert value is not None
-    assert value["hot_take"] == "Legacy entry"
+    assert value == payloads[1]
+    assert pool_size == 2
+    service._client.lrange.assert_awaited_once_with(
+        "hot_take:v2:ai:witty:openai", 0, -1
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_get_random_payload_returns_raw_entry():
+    service = CacheService()
+    service._client = AsyncMock()
+    payload = json.dumps({"hot_take": "Take one", "style": "witty"})
+    service._client.lrange.return_value = [payload]
+
+    value, pool_size = await service.get_random_payload("ai", "witty", None)
+
+    assert value == payload
     assert pool_size == 1
 
 
 @pytest.mark.asyncio
-async def test_cache_add_variant_dedupes_and_trims_pool():
+async def test_cache_get_random_payload_empty_pool():
+    service = CacheService()
+    service._client = AsyncMock()
+    service._client.lrange.return_value = []
+
+    value, pool_size = await service.get_random_payload("ai", "witty", None)
+
+    assert value is None
+    assert pool_size == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_add_variant_payload_pushes_deduped_and_trimmed():
     service = CacheService()
     service._client = AsyncMock()
     service.max_variants = 2
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[1, 3, True, True])
+    service._client.pipeline = MagicMock(return_value=pipe)
 
-    existing = [
-        {
-            "hot_take": "Take one",
-            "topic": "ai",
-            "style": "witty",
-            "agent_used": "OpenAI Agent",
-        },
-        {
-            "hot_take": "Take two",
-            "topic": "ai",
-            "style": "witty",
-            "agent_used": "OpenAI Agent",
-        },
-    ]
-    service._client.get.return_value = json.dumps(existing)
-
-    pool_size = await service.add_variant(
-        "ai",
-        "witty",
-        "openai",
-        {
-            "hot_take": "Take two",
-            "topic": "ai",
-            "style": "witty",
-            "agent_used": "OpenAI Agent",
-        },
-    )
+    payload = json.dumps({"topic": "ai", "hot_take": "Take two", "style": "witty"})
+    pool_size = await service.add_variant_payload("ai", "witty", "openai", payload)
 
+    key = "hot_take:v2:ai:witty:openai"
     assert pool_size == 2
-    service._client.setex.assert_called_once()
-    saved_payload = service._client.setex.call_args.args[2]
-    saved_variants = json.loads(saved_payload)
-    assert len(saved_variants) == 2
-    assert [item["hot_take"] for item in saved_variants] == ["Take one", "Take two"]
+    pipe.lrem.assert_called_once_with(key, 0, payload)
+    pipe.lpush.assert_called_once_with(key, payload)
+    pipe.ltrim.assert_called_once_with(key, 0, 1)
+    pipe.expire.assert_called_once_with(key, settings.cache_ttl_seconds)
+
+
+@pytest.mark.asyncio
+async def test_cache_add_variant_payload_stores_payload_verbatim():
+    service = CacheService()
+    service._client = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[0, 1, True, True])
+    service._client.pipeline = MagicMock(return_value=pipe)
+
+    payload = '{"hot_take":"Take","topic":"ai"}'
+    assert await service.add_variant_payload("ai", "witty", None, payload) == 1
+    pipe.lpush.assert_called_once_with("hot_take:v2:ai:witty", payload)
+
+
+@pytest.mark.asyncio
+async def test_cache_add_variant_payload_swallows_redis_errors():
+    service = CacheService()
+    service._client = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(side_effect=ConnectionError("redis down"))
+    service._client.pipeline = MagicMock(return_value=pipe)
+
+    assert (
+        await service.add_variant_payload("ai", "witty", None, '{"hot_take":"x"}') == 0
+    )
+
+
+def test_response_cache_returns_stored_value_until_expiry():
+    cache = ResponseCache(max_entries=4, ttl_seconds=60)
+    key = ResponseCache.make_key("OpenAI Agent", "witty", " AI ", "context")
+
+    cache.set(key, "Cached take")
+    assert cache.get(key) == "Cached take"
+    assert key == ResponseCache.make_key("OpenAI Agent", "witty", "ai", "context")
+    assert key != ResponseCache.make_key("OpenAI Agent", "witty", "ai", "other")
+
+    with patch("app.services.response_cache.time.monotonic", return_value=1e12):
+        assert cache.get(key) is None
+    assert len(cache) == 0
+
+
+def test_cache_keys_ignore_case_spacing_and_edge_punctuation():
+    service = CacheService()
+    assert service._make_key("  AI   Regulation? ", "witty", None) == (
+        service._make_key("ai regulation", "witty", None)
+    )
+    assert ResponseCache.make_key("Agent", "witty", "AI  regulation!", None) == (
+        ResponseCache.make_key("Agent", "witty", "ai regulation", None)
+    )
+
+
+def test_response_cache_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", "take a")
+    cache.set("b", "take b")
+    cache.get("a")
+    cache.set("c", "take c")
+
+    assert cache.get("a") == "take a"
+    assert cache.get("b") is None
+    assert cache.get("c") == "take c"
+
+
+def test_response_cache_disabled_with_zero_entries():
+    cache = ResponseCache(max_entries=0, ttl_seconds=60)
+    cache.set("a", "take a")
+    assert cache.get("a") is None
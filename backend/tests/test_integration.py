@@ -1,8 +1,14 @@
 import pytest
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from fastapi.testclient import TestClient
 from app.main import app
-from tests.utils import TestDataFactory, assert_response_format
+from tests.utils import (
+    TestDataFactory,
+    assert_response_format,
+    async_iterate,
+    create_mock_anthropic_stream,
+    create_mock_openai_chunk,
+)
 from app.models.schemas import HotTakeResponse
 
 
@@ -114,17 +120,15 @@ class TestServiceIntegration:
 
         # Setup API client mocks
         mock_openai_instance = AsyncMock()
-        mock_openai_response = AsyncMock()
-        mock_openai_response.choices = [AsyncMock()]
-        mock_openai_response.choices[0].message.content = "OpenAI integration test"
-        mock_openai_instance.chat.completions.create.return_value = mock_openai_response
+        mock_openai_instance.chat.completions.create.return_value = async_iterate(
+            create_mock_openai_chunk("OpenAI integration test")
+        )
         mock_openai_client.return_value = mock_openai_instance
 
         mock_anthropic_instance = AsyncMock()
-        mock_anthropic_response = AsyncMock()
-        mock_anthropic_response.content = [AsyncMock()]
-        mock_anthropic_response.content[0].text = "Anthropic integration test"
-        mock_anthropic_instance.messages.create.return_value = mock_anthropic_response
+        mock_anthropic_instance.messages.stream = MagicMock(
+            return_value=create_mock_anthropic_stream("Anthropic integration test")
+        )
         mock_anthropic_client.return_value = mock_anthropic_instance
 
         # Test service
@@ -1,22 +1,25 @@
 import pytest
 from pydantic import ValidationError
-from app.models.schemas import HotTakeRequest, HotTakeResponse, AgentConfig
+from app.core.prompts import StylePrompts
+from app.models.schemas import (
+    MAX_BATCH_STYLES,
+    AgentConfig,
+    HotTakeBatchRequest,
+    HotTakeRequest,
+    HotTakeResponse,
+)
 
 
 class TestHotTakeRequest:
     def test_hot_take_request_valid(self):
-        request = HotTakeRequest(
-            topic="artificial intelligence", style="controversial", length="medium"
-        )
+        request = HotTakeRequest(topic="artificial intelligence", style="controversial")
         assert request.topic == "artificial intelligence"
         assert request.style == "controversial"
-        assert request.length == "medium"
 
     def test_hot_take_request_minimal(self):
         request = HotTakeRequest(topic="test topic")
         assert request.topic == "test topic"
         assert request.style == "controversial"  # default
-        assert request.length == "medium"  # default
 
     def test_hot_take_request_missing_topic(self):
         with pytest.raises(ValidationError) as exc_info:
@@ -39,19 +42,28 @@ class TestHotTakeRequest:
         request = HotTakeRequest(topic="technology", style="sarcastic")
         assert request.style == "sarcastic"
 
-    def test_hot_take_request_custom_length(self):
+    def test_hot_take_request_normalizes_style(self):
+        assert HotTakeRequest(topic="tech", style=" Witty ").style == "witty"
+        assert HotTakeRequest(topic="tech", style=None).style == "controversial"
+
+    def test_hot_take_request_interns_style(self):
+        style = HotTakeRequest(topic="tech", style="WITTY".lower()).style
+        assert style is next(key for key in StylePrompts.BASE_PROMPTS if key == style)
+
+    def test_hot_take_request_rejects_unknown_style(self):
+        with pytest.raises(ValidationError):
+            HotTakeRequest(topic="technology", style="spicy")
+
+    def test_hot_take_request_ignores_legacy_length(self):
         request = HotTakeRequest(topic="technology", length="long")
-        assert request.length == "long"
+        assert "length" not in request.model_dump()
 
     def test_hot_take_request_json_serialization(self):
-        request = HotTakeRequest(
-            topic="climate change", style="optimistic", length="short"
-        )
+        request = HotTakeRequest(topic="climate change", style="optimistic")
         json_data = request.model_dump()
 
         assert json_data["topic"] == "climate change"
         assert json_data["style"] == "optimistic"
-        assert json_data["length"] == "short"
 
     def test_hot_take_request_valid_agent_type(self):
         request = HotTakeRequest(topic="technology", agent_type="openai")
@@ -183,11 +195,35 @@ class TestAgentConfig:
         )
 
 
+class TestHotTakeBatchRequest:
+    def test_batch_request_valid(self):
+        request = HotTakeBatchRequest(topic=" ai ", styles=["witty", "absurd"])
+        assert request.topic == "ai"
+        assert request.styles == ["witty", "absurd"]
+
+    def test_batch_request_requires_styles(self):
+        with pytest.raises(ValidationError):
+            HotTakeBatchRequest(topic="ai", styles=[])
+
+    def test_batch_request_limits_styles(self):
+        with pytest.raises(ValidationError):
+            HotTakeBatchRequest(topic="ai", styles=["witty"] * (MAX_BATCH_STYLES + 1))
+
+    def test_batch_request_rejects_single_style_field(self):
+        with pytest.raises(ValidationError):
+            HotTakeBatchRequest(topic="ai", styles=["witty"], style="absurd")
+
+    def test_batch_request_rejects_unknown_style(self):
+        with pytest.raises(ValidationError):
+            HotTakeBatchRequest(topic="ai", styles=["witty", "spicy"])
+
+
 class TestHotTakeRequestNewFields:
     def test_news_days_default(self):
         request = HotTakeRequest(topic="test topic")
         assert request.news_days == 14
         assert request.strict_quality_mode is False
+        assert request.bypass_cache is False
 
     def test_news_days_valid_values(self):
         for days in [1, 7, 14, 30, 90]:
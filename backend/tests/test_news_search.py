@@ -1,7 +1,8 @@
+import asyncio
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timedelta, timezone
-from app.services.news_search_service import NewsSearchService
+from app.services.news_search_service import AsyncNewsApiClient, NewsSearchService
 
 
 class TestNewsSearchService:
@@ -20,6 +21,38 @@ class TestNewsSearchService:
         service = NewsSearchService()
         assert service.newsapi_client is not None
 
+    @pytest.mark.asyncio
+    async def test_newsapi_client_uses_shared_http_client(self):
+        """Test NewsAPI requests go through the pooled search HTTP client."""
+        http_client = MagicMock()
+        http_client.get = AsyncMock(
+            return_value=MagicMock(content=b'{"status": "ok", "articles": []}')
+        )
+        client = AsyncNewsApiClient(api_key="test_api_key")
+
+        with patch(
+            "app.services.news_search_service.get_search_client",
+            return_value=http_client,
+        ):
+            response = await client.get_everything(
+                q="AI latest",
+                language="en",
+                sort_by="publishedAt",
+                page_size=10,
+                from_param="2024-11-01",
+            )
+
+        assert response == {"status": "ok", "articles": []}
+        call = http_client.get.call_args
+        assert call.kwargs["headers"] == {"X-Api-Key": "test_api_key"}
+        assert call.kwargs["params"] == {
+            "q": "AI latest",
+            "language": "en",
+            "sortBy": "publishedAt",
+            "pageSize": 10,
+            "from": "2024-11-01",
+        }
+
     @patch("app.services.news_search_service.settings")
     def test_newsapi_client_initialization_without_key(self, mock_settings):
         """Test NewsAPI client is None when API key is missing."""
@@ -81,7 +114,7 @@ class TestNewsSearchService:
         }
 
         # Mock the NewsAPI client
-        service.newsapi_client = MagicMock()
+        service.newsapi_client = AsyncMock()
         service.newsapi_client.get_everything.return_value = mock_newsapi_response
 
         articles = await service.search_recent_news("AI", max_results=2)
@@ -93,6 +126,41 @@ class TestNewsSearchService:
         assert isinstance(articles[0]["published"], datetime)
         assert articles[1]["title"] == "Machine learning advances"
 
+    @pytest.mark.asyncio
+    async def test_search_recent_news_reuses_results_for_repeat_queries(self):
+        """Test concurrent and repeat searches share one NewsAPI fetch."""
+        service = NewsSearchService()
+        service.newsapi_client = AsyncMock()
+        article = {"title": "AI news", "url": "https://example.com/ai"}
+        service._fetch_news_api_articles = AsyncMock(return_value=[article])
+
+        first, second = await asyncio.gather(
+            service.search_recent_news("AI", max_results=2, days_back=7),
+            service.search_recent_news("ai ", max_results=2, days_back=7),
+        )
+        third = await service.search_recent_news("AI", max_results=2, days_back=7)
+
+        assert first == second == third == [article]
+        service._fetch_news_api_articles.assert_called_once()
+
+        await service.search_recent_news("AI", max_results=2, days_back=30)
+        assert service._fetch_news_api_articles.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_recent_news_times_out_slow_fetch(self):
+        """Test a hung NewsAPI call degrades to no results."""
+        service = NewsSearchService()
+        service.newsapi_client = AsyncMock()
+        service.search_timeout = 0.01
+
+        async def slow_fetch(*args):
+            await asyncio.sleep(0.2)
+            return [{}]
+
+        service._fetch_news_api_articles = slow_fetch
+
+        assert await service.search_recent_news("AI", max_results=2) == []
+
     @pytest.mark.asyncio
     @patch("app.services.news_search_service.settings")
     async def test_search_recent_news_api_error(self, mock_settings):
@@ -101,7 +169,7 @@ class TestNewsSearchService:
         service = NewsSearchService()
 
         # Mock NewsAPI to raise an exception
-        service.newsapi_client = MagicMock()
+        service.newsapi_client = AsyncMock()
         service.newsapi_client.get_everything.side_effect = Exception("API error")
 
         articles = await service.search_recent_news("test", max_results=5)
@@ -121,7 +189,7 @@ class TestNewsSearchService:
             "message": "Invalid API key",
         }
 
-        service.newsapi_client = MagicMock()
+        service.newsapi_client = AsyncMock()
         service.newsapi_client.get_everything.return_value = mock_newsapi_response
 
         articles = await service.search_recent_news("test", max_results=5)
@@ -131,7 +199,7 @@ class TestNewsSearchService:
         """Test formatting with no articles."""
         service = NewsSearchService()
         context = service.format_news_context([])
-        assert "No recent news found" in context
+        assert context is None
 
     def test_format_news_context_with_articles(self):
         """Test formatting with multiple articles."""
@@ -213,7 +281,7 @@ class TestNewsSearchService:
             ],
         }
 
-        service.newsapi_client = MagicMock()
+        service.newsapi_client = AsyncMock()
         service.newsapi_client.get_everything.return_value = mock_response
 
         await service.search_recent_news("AI", max_results=5)
@@ -252,7 +320,7 @@ class TestNewsSearchService:
                 },
             ],
         }
-        service.newsapi_client = MagicMock()
+        service.newsapi_client = AsyncMock()
         service.newsapi_client.get_everything.return_value = mock_response
 
         articles = await service.search_recent_news("AI", max_results=5, days_back=7)
@@ -293,7 +361,7 @@ class TestNewsSearchService:
                 },
             ],
         }
-        service.newsapi_client = MagicMock()
+        service.newsapi_client = AsyncMock()
         service.newsapi_client.get_everything.return_value = mock_response
 
         articles = await service.search_recent_news(
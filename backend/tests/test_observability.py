@@ -0,0 +1,40 @@
+from unittest.mock import MagicMock, patch
+
+from app.observability import langfuse
+
+
+def test_langfuse_client_is_built_once():
+    langfuse.get_langfuse_client.cache_clear()
+    fake_client = MagicMock()
+    try:
+        with (
+            patch.object(
+                langfuse, "Langfuse", return_value=fake_client
+            ) as mock_langfuse,
+            patch.multiple(
+                langfuse.settings,
+                langfuse_tracing_enabled=True,
+                langfuse_public_key="pk",
+                langfuse_secret_key="sk",
+            ),
+        ):
+            assert langfuse.get_langfuse_client() is fake_client
+            assert langfuse.get_langfuse_client() is fake_client
+        mock_langfuse.assert_called_once()
+    finally:
+        langfuse.get_langfuse_client.cache_clear()
+
+
+def test_disabled_tracing_reuses_null_context():
+    langfuse.get_langfuse_client.cache_clear()
+    try:
+        with patch.object(langfuse.settings, "langfuse_tracing_enabled", False):
+            first = langfuse.start_request_span(name="a", input_data={}, metadata={})
+            second = langfuse.start_generation_observation(
+                name="b", input_data={}, metadata={}, model="m", model_parameters={}
+            )
+        assert first is second
+        with first as span:
+            assert span is None
+    finally:
+        langfuse.get_langfuse_client.cache_clear()
@@ -0,0 +1,76 @@
+import app.main as main_module
+from app.core.rate_limit import RingLimiter
+from app.models.schemas import MAX_BATCH_STYLES
+
+
+class TestRingLimiter:
+    def test_admits_up_to_capacity_within_window(self):
+        limiter = RingLimiter(3)
+        assert [limiter.allow(t, 60) for t in range(4)] == [
+            True,
+            True,
+            True,
+            False,
+        ]
+
+    def test_oldest_slot_frees_once_it_leaves_the_window(self):
+        limiter = RingLimiter(2)
+        assert limiter.allow(0, 60)
+        assert limiter.allow(30, 60)
+        assert not limiter.allow(60, 60)
+        assert limiter.allow(61, 60)
+        assert not limiter.allow(89, 60)
+        assert limiter.allow(91, 60)
+        assert limiter.last == 91
+
+    def test_multi_slot_cost_needs_room_for_every_slot(self):
+        limiter = RingLimiter(3)
+        assert limiter.allow(0, 60)
+        assert limiter.allow(10, 60, cost=2)
+        assert not limiter.allow(20, 60)
+        # Only the first slot has expired, which is not enough for two.
+        assert not limiter.allow(61, 60, cost=2)
+        assert limiter.allow(71, 60, cost=2)
+        assert limiter.count == 3
+        assert limiter.last == 71
+
+    def test_cost_above_capacity_is_rejected(self):
+        limiter = RingLimiter(2)
+        assert not limiter.allow(0, 60, cost=3)
+        assert limiter.count == 0
+
+    def test_zero_capacity_rejects_everything(self):
+        limiter = RingLimiter(0)
+        assert not limiter.allow(0, 60)
+        assert limiter.last == float("-inf")
+
+
+def test_idle_limiters_are_swept_when_table_grows(monkeypatch):
+    monkeypatch.setattr(main_module, "_LIMITER_SWEEP_MIN_SIZE", 2)
+    monkeypatch.setattr(main_module, "_limiter_sweep_size", 2)
+
+    window_ns = main_module._RATE_LIMIT_WINDOW_NS
+    main_module._get_limiter("idle", 0).allow(0, window_ns)
+    main_module._get_limiter("active", 2 * window_ns).allow(2 * window_ns, window_ns)
+    main_module._get_limiter("new", 2 * window_ns + 1)
+
+    assert set(main_module.request_timestamps_by_ip) == {"active", "new"}
+    assert isinstance(main_module.request_timestamps_by_ip["new"], RingLimiter)
+
+
+def test_non_generate_requests_bypass_the_limiter(client):
+    assert client.get("/health").status_code == 200
+    assert client.get("/api/generate").status_code == 405
+    assert main_module.request_timestamps_by_ip == {}
+
+
+def test_generate_requests_are_counted(client):
+    client.post("/api/generate", json={"topic": ""})
+    assert list(main_module.request_timestamps_by_ip) == ["testclient"]
+    assert main_module.request_timestamps_by_ip["testclient"].count == 1
+
+
+def test_batch_requests_are_charged_per_style_budget(client):
+    client.post("/api/generate/batch", json={"topic": "", "styles": ["witty"]})
+    limiter = main_module.request_timestamps_by_ip["testclient"]
+    assert limiter.count == MAX_BATCH_STYLES
@@ -1,7 +1,12 @@
+import json
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 import httpx
 from app.services.search_providers.brave_provider import BraveSearchProvider
+from app.services.search_providers.http_client import (
+    close_search_client,
+    get_search_client,
+)
 from app.services.search_providers.serper_provider import SerperSearchProvider
 
 
@@ -61,7 +66,7 @@ class TestBraveSearchProvider:
         }
 
         mock_response = MagicMock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_response.raise_for_status = MagicMock()
 
         mock_client = MagicMock()
@@ -157,7 +162,7 @@ class TestSerperSearchProvider:
         }
 
         mock_response = MagicMock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_response.raise_for_status = MagicMock()
 
         mock_client = MagicMock()
@@ -198,3 +203,17 @@ class TestSerperSearchProvider:
 
             results = await provider.search("test query", max_results=5)
             assert results == []
+
+
+class TestSearchHttpClient:
+    """Tests for the HTTP client shared by the search providers."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_shared_and_reset_on_close(self):
+        client = get_search_client()
+        assert get_search_client() is client
+
+        await close_search_client()
+        assert client.is_closed
+        assert get_search_client() is not client
+        await close_search_client()
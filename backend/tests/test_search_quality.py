@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta, timezone
+from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 
 from app.services.search_quality import (
@@ -80,6 +80,9 @@ class TestExtractDomain:
     def test_uppercase_normalized(self):
         assert extract_domain("HTTPS://WWW.BBC.COM/news") == "bbc.com"
 
+    def test_bare_domain_with_path(self):
+        assert extract_domain("www.bbc.com/news?id=1") == "bbc.com"
+
 
 class TestNormalizeUrl:
     def test_strips_trailing_slash(self):
@@ -97,6 +100,10 @@ class TestNormalizeUrl:
         result = normalize_url("https://EXAMPLE.COM/Page")
         assert "example.com" in result
 
+    def test_drops_query_and_fragment(self):
+        result = normalize_url("https://www.example.com/Page/?utm_source=x#top")
+        assert result == "example.com/Page"
+
 
 class TestParseDateString:
     def test_iso_format(self):
@@ -112,33 +119,33 @@ class TestParseDateString:
         assert result.tzinfo is not None
 
     def test_relative_days_ago(self):
-        now = datetime(2024, 11, 15, 12, 0, 0, tzinfo=timezone.utc)
+        now = datetime(2024, 11, 15, 12, 0, 0, tzinfo=UTC)
         result = parse_date_string("3 days ago", now=now)
         assert result is not None
         assert result == now - timedelta(days=3)
 
     def test_relative_hours_ago(self):
-        now = datetime(2024, 11, 15, 12, 0, 0, tzinfo=timezone.utc)
+        now = datetime(2024, 11, 15, 12, 0, 0, tzinfo=UTC)
         result = parse_date_string("5 hours ago", now=now)
         assert result == now - timedelta(hours=5)
 
     def test_relative_weeks_ago(self):
-        now = datetime(2024, 11, 15, 12, 0, 0, tzinfo=timezone.utc)
+        now = datetime(2024, 11, 15, 12, 0, 0, tzinfo=UTC)
         result = parse_date_string("2 weeks ago", now=now)
         assert result == now - timedelta(weeks=2)
 
     def test_relative_minutes_ago(self):
-        now = datetime(2024, 11, 15, 12, 0, 0, tzinfo=timezone.utc)
+        now = datetime(2024, 11, 15, 12, 0, 0, tzinfo=UTC)
         result = parse_date_string("30 minutes ago", now=now)
         assert result == now - timedelta(minutes=30)
 
     def test_relative_month_ago(self):
-        now = datetime(2024, 11, 15, 12, 0, 0, tzinfo=timezone.utc)
+        now = datetime(2024, 11, 15, 12, 0, 0, tzinfo=UTC)
         result = parse_date_string("1 month ago", now=now)
         assert result == now - timedelta(days=30)
 
     def test_relative_year_ago(self):
-        now = datetime(2024, 11, 15, 12, 0, 0, tzinfo=timezone.utc)
+        now = datetime(2024, 11, 15, 12, 0, 0, tzinfo=UTC)
         result = parse_date_string("1 year ago", now=now)
         assert result == now - timedelta(days=365)
 
@@ -167,6 +174,15 @@ class TestParseDateString:
     def test_unparseable_string(self):
         assert parse_date_string("not a date at all") is None
 
+    def test_repeat_absolute_dates_reuse_parse(self):
+        assert parse_date_string("Nov 01, 2024") is parse_date_string(" Nov 01, 2024")
+
+    def test_relative_dates_follow_now(self):
+        first = datetime(2024, 11, 15, tzinfo=UTC)
+        second = first + timedelta(days=1)
+        assert parse_date_string("1 day ago", now=first) == first - timedelta(days=1)
+        assert parse_date_string("1 day ago", now=second) == first
+
 
 class TestTokenize:
     def test_basic_tokenization(self):
@@ -194,6 +210,9 @@ class TestTokenize:
         assert "ai" in tokens
         assert "technology" in tokens
 
+    def test_repeat_text_reuses_cached_tokens(self):
+        assert tokenize("Repeated Headline") is tokenize("repeated headline")
+
 
 class TestDomainAllowed:
     def test_allowed_no_lists(self):
@@ -217,6 +236,11 @@ class TestDomainAllowed:
     def test_blocklist_takes_precedence(self):
         assert domain_allowed("spam.com", {"spam.com"}, {"spam.com"}) is False
 
+    def test_verdict_follows_list_contents(self):
+        blocklist = parse_domain_list("spam.com")
+        assert domain_allowed("spam.com", frozenset(), blocklist) is False
+        assert domain_allowed("spam.com", frozenset(), frozenset()) is True
+
 
 class TestDedupeRecords:
     def test_dedupes_by_url(self):
@@ -255,10 +279,24 @@ class TestDedupeRecords:
         result = dedupe_records(records)
         assert len(result) == 1
 
+    def test_keeps_newer_copy_in_first_position(self):
+        older = datetime(2024, 11, 1, tzinfo=UTC)
+        records = [
+            {"title": "Old", "url": "http://example.com/a", "published": older},
+            {"title": "Other", "url": "https://example.com/b"},
+            {
+                "title": "New",
+                "url": "https://example.com/a?utm_source=feed",
+                "published": datetime(2024, 11, 2),
+            },
+        ]
+        result = dedupe_records(records)
+        assert [r["title"] for r in result] == ["New", "Other"]
+
 
 class TestApplyRecencyWindow:
     def test_filters_old_articles(self):
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         records = [
             {"title": "Recent", "published": now - timedelta(days=2)},
             {"title": "Old", "published": now - timedelta(days=30)},
@@ -268,7 +306,7 @@ class TestApplyRecencyWindow:
         assert result[0]["title"] == "Recent"
 
     def test_keeps_articles_without_dates(self):
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         records = [
             {"title": "No date", "published": None},
             {"title": "Recent", "published": now - timedelta(days=1)},
@@ -277,7 +315,7 @@ class TestApplyRecencyWindow:
         assert len(result) == 2
 
     def test_zero_days_returns_all(self):
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         records = [
             {"title": "Old", "published": now - timedelta(days=365)},
         ]
@@ -285,7 +323,7 @@ class TestApplyRecencyWindow:
         assert len(result) == 1
 
     def test_naive_datetime_treated_as_utc(self):
-        naive_date = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=2)
+        naive_date = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=2)
         records = [
             {"title": "Naive", "published": naive_date},
         ]
@@ -308,13 +346,13 @@ class TestScoreRecord:
             "title": "Artificial Intelligence breakthrough",
             "snippet": "New AI intelligence model released today",
             "source": "reuters.com",
-            "published": datetime.now(timezone.utc) - timedelta(days=1),
+            "published": datetime.now(UTC) - timedelta(days=1),
         }
         irrelevant = {
             "title": "Cooking recipes for dinner",
             "snippet": "Best pasta recipes for family meals",
             "source": "recipes.com",
-            "published": datetime.now(timezone.utc) - timedelta(days=1),
+            "published": datetime.now(UTC) - timedelta(days=1),
         }
         score_relevant = score_record(relevant, **self._default_kwargs())
         score_irrelevant = score_record(irrelevant, **self._default_kwargs())
@@ -325,13 +363,13 @@ class TestScoreRecord:
             "title": "AI news update",
             "snippet": "Artificial intelligence developments",
             "source": "reuters.com",
-            "published": datetime.now(timezone.utc),
+            "published": datetime.now(UTC),
         }
         untrusted = {
             "title": "AI news update",
             "snippet": "Artificial intelligence developments",
             "source": "randomblog.com",
-            "published": datetime.now(timezone.utc),
+            "published": datetime.now(UTC),
         }
         kwargs = self._default_kwargs()
         assert score_record(trusted, **kwargs) > score_record(untrusted, **kwargs)
@@ -341,13 +379,13 @@ class TestScoreRecord:
             "title": "AI artificial intelligence news",
             "snippet": "Latest developments",
             "source": "example.com",
-            "published": datetime.now(timezone.utc) - timedelta(hours=6),
+            "published": datetime.now(UTC) - timedelta(hours=6),
         }
         old = {
             "title": "AI artificial intelligence news",
             "snippet": "Latest developments",
             "source": "example.com",
-            "published": datetime.now(timezone.utc) - timedelta(days=13),
+            "published": datetime.now(UTC) - timedelta(days=13),
         }
         kwargs = self._default_kwargs()
         assert score_record(recent, **kwargs) > score_record(old, **kwargs)
@@ -357,7 +395,7 @@ class TestScoreRecord:
             "title": "Cooking recipes",
             "snippet": "Best pasta recipes",
             "source": "food.com",
-            "published": datetime.now(timezone.utc),
+            "published": datetime.now(UTC),
         }
         kwargs = self._default_kwargs()
         normal_score = score_record(record, **{**kwargs, "strict_quality_mode": False})
@@ -390,6 +428,34 @@ class TestScoreRecord:
         score = score_record(record, **self._default_kwargs())
         assert score > 0  # Should still have a positive score
 
+    def test_recency_uses_injected_now(self):
+        published = datetime(2024, 11, 1, tzinfo=UTC)
+        record = {
+            "title": "AI artificial intelligence",
+            "snippet": "News about AI developments",
+            "source": "example.com",
+            "published": published,
+        }
+        kwargs = self._default_kwargs()
+        fresh = score_record(record, **kwargs, now=published + timedelta(hours=1))
+        stale = score_record(record, **kwargs, now=published + timedelta(days=30))
+        assert fresh > stale
+
+    def test_precomputed_text_tokens_match(self):
+        record = {
+            "title": "AI artificial intelligence",
+            "snippet": "News about AI developments",
+            "source": "example.com",
+            "published": None,
+        }
+        kwargs = self._default_kwargs()
+        precomputed = score_record(
+            record,
+            **kwargs,
+            text_tokens=tokenize(f"{record['title']} {record['snippet']}"),
+        )
+        assert precomputed == score_record(record, **kwargs)
+
 
 class TestSearchQualityConfig:
     def test_loads_defaults_from_settings(self):
@@ -1,6 +1,9 @@
+import asyncio
+import json
 import pytest
 from contextlib import nullcontext
 from unittest.mock import AsyncMock, MagicMock, patch
+from app.core.config import settings
 from app.services.hot_take_service import HotTakeService
 from app.models.schemas import HotTakeResponse
 
@@ -19,6 +22,48 @@ class TestHotTakeService:
         assert "openai" in agents
         assert "anthropic" in agents
 
+    def test_get_available_agents_metadata_is_built_once(self):
+        service = HotTakeService()
+        with patch.object(
+            service.agents["openai"], "get_system_prompt", return_value="prompt"
+        ) as get_system_prompt:
+            first = service.get_available_agents_metadata()
+            second = service.get_available_agents_metadata()
+
+        assert [config.id for config in first] == ["openai", "anthropic"]
+        assert first == second
+        get_system_prompt.assert_called_once_with("controversial")
+
+    def test_build_source_records_skips_incomplete_results(self):
+        service = HotTakeService()
+        records = service._build_news_source_records(
+            [
+                {"title": " Headline ", "url": "https://a.example", "summary": ""},
+                {"title": "No URL", "url": "  "},
+                {"title": "", "url": "https://b.example"},
+            ]
+        )
+
+        assert len(records) == 1
+        assert records[0].model_dump(mode="json") == {
+            "type": "news",
+            "title": "Headline",
+            "url": "https://a.example",
+            "snippet": None,
+            "source": None,
+            "published": None,
+        }
+
+    @patch("app.services.hot_take_service.WebSearchService")
+    def test_provider_web_search_service_is_reused(self, mock_web_search):
+        service = HotTakeService()
+        mock_web_search.reset_mock()
+
+        brave = service._get_web_search_service("brave")
+        assert service._get_web_search_service("brave") is brave
+        assert service._get_web_search_service(None) is service.web_search_service
+        mock_web_search.assert_called_once_with(provider_name="brave")
+
     def test_get_available_styles(self):
         service = HotTakeService()
         styles = service.get_available_styles()
@@ -116,8 +161,8 @@ class TestHotTakeService:
 
         service = HotTakeService()
         # Isolate from cache so random.choice inside CacheService doesn't interfere
-        service.cache.get_random_variant = AsyncMock(return_value=(None, 0))
-        service.cache.add_variant = AsyncMock(return_value=1)
+        service.cache.get_random_payload = AsyncMock(return_value=(None, 0))
+        service.cache.add_variant_payload = AsyncMock(return_value=1)
 
         result = await service.generate_hot_take(topic="random topic", style="absurd")
 
@@ -180,6 +225,40 @@ class TestHotTakeService:
             "test topic", "controversial", None
         )
 
+    @pytest.mark.asyncio
+    @patch("app.services.hot_take_service.start_generation_observation")
+    @patch("app.services.hot_take_service.OpenAIAgent")
+    @patch("app.services.hot_take_service.AnthropicAgent")
+    async def test_generate_hot_take_traces_system_prompt_tokens(
+        self,
+        mock_anthropic,
+        mock_openai,
+        mock_start_generation_observation,
+    ):
+        mock_openai_instance = AsyncMock()
+        mock_openai_instance.name = "OpenAI Agent"
+        mock_openai_instance.generate_hot_take.return_value = "Fresh take"
+        mock_openai_instance.get_system_prompt = MagicMock(return_value="x" * 40)
+        mock_openai.return_value = mock_openai_instance
+        mock_anthropic.return_value = AsyncMock()
+
+        generation = MagicMock()
+        mock_start_generation_observation.return_value = nullcontext(generation)
+
+        service = HotTakeService()
+        service.cache.get_random_payload = AsyncMock(return_value=(None, 0))
+        service.cache.add_variant_payload = AsyncMock()
+
+        await service.generate_hot_take(
+            topic="test topic", style="controversial", agent_type="openai"
+        )
+
+        mock_openai_instance.get_system_prompt.assert_called_once_with(
+            "controversial", False
+        )
+        metadata = generation.update.call_args.kwargs["metadata"]
+        assert metadata["system_prompt_tokens"] == 10
+
     @pytest.mark.asyncio
     @patch("app.services.hot_take_service.start_generation_observation")
     @patch("app.services.hot_take_service.OpenAIAgent")
@@ -200,21 +279,23 @@ class TestHotTakeService:
 
         service = HotTakeService()
         service.cache.max_variants = 5
-        service.cache.get_random_variant = AsyncMock(
+        service.cache.get_random_payload = AsyncMock(
             return_value=(
-                {
-                    "hot_take": "Cached take",
-                    "topic": "test topic",
-                    "style": "controversial",
-                    "agent_used": "OpenAI Agent",
-                    "web_search_used": False,
-                    "news_context": None,
-                    "sources": None,
-                },
+                json.dumps(
+                    {
+                        "hot_take": "Cached take",
+                        "topic": "test topic",
+                        "style": "controversial",
+                        "agent_used": "OpenAI Agent",
+                        "web_search_used": False,
+                        "news_context": None,
+                        "sources": None,
+                    }
+                ),
                 5,
             )
         )
-        service.cache.add_variant = AsyncMock()
+        service.cache.add_variant_payload = AsyncMock()
 
         result = await service.generate_hot_take(
             topic="test topic",
@@ -224,7 +305,7 @@ class TestHotTakeService:
 
         assert result.hot_take == "Cached take"
         mock_openai_instance.generate_hot_take.assert_not_called()
-        service.cache.add_variant.assert_not_called()
+        service.cache.add_variant_payload.assert_not_called()
 
         call_kwargs = mock_start_generation_observation.call_args.kwargs
         assert call_kwargs["metadata"]["cache_hit"] is True
@@ -232,6 +313,35 @@ class TestHotTakeService:
         assert call_kwargs["model"] == "cache"
         generation.update.assert_called_once()
 
+    @pytest.mark.asyncio
+    @patch("app.services.hot_take_service.OpenAIAgent")
+    @patch("app.services.hot_take_service.AnthropicAgent")
+    async def test_cached_variant_hits_share_one_decoded_response(
+        self, mock_anthropic, mock_openai
+    ):
+        mock_openai.return_value = AsyncMock()
+        mock_anthropic.return_value = AsyncMock()
+
+        payload = HotTakeResponse(
+            hot_take="Cached take",
+            topic="test topic",
+            style="controversial",
+            agent_used="OpenAI Agent",
+            sources=[{"type": "web", "title": "Source", "url": "https://a.example"}],
+        ).model_dump_json()
+        service = HotTakeService()
+        service.cache.max_variants = 1
+        service.cache.get_random_payload = AsyncMock(return_value=(payload, 1))
+
+        first = await service.generate_hot_take(topic="test topic", agent_type="openai")
+        second = await service.generate_hot_take(
+            topic="test topic", agent_type="openai"
+        )
+
+        # Hits skip re-validation entirely; the shared instance is read-only.
+        assert second is first
+        assert second.model_dump_json() == payload
+
     @pytest.mark.asyncio
     @patch("app.services.hot_take_service.start_generation_observation")
     @patch("app.services.hot_take_service.OpenAIAgent")
@@ -254,18 +364,20 @@ class TestHotTakeService:
 
         service = HotTakeService()
         service.cache.max_variants = 5
-        service.cache.get_random_variant = AsyncMock(
+        service.cache.get_random_payload = AsyncMock(
             return_value=(
-                {
-                    "hot_take": "Cached but pool not full",
-                    "topic": "test topic",
-                    "style": "controversial",
-                    "agent_used": "OpenAI Agent",
-                },
+                json.dumps(
+                    {
+                        "hot_take": "Cached but pool not full",
+                        "topic": "test topic",
+                        "style": "controversial",
+                        "agent_used": "OpenAI Agent",
+                    }
+                ),
                 4,
             )
         )
-        service.cache.add_variant = AsyncMock(return_value=5)
+        service.cache.add_variant_payload = AsyncMock(return_value=5)
 
         result = await service.generate_hot_take(
             topic="test topic",
@@ -277,7 +389,7 @@ class TestHotTakeService:
         mock_openai_instance.generate_hot_take.assert_called_once_with(
             "test topic", "controversial", None
         )
-        service.cache.add_variant.assert_called_once()
+        service.cache.add_variant_payload.assert_called_once()
 
         call_kwargs = mock_start_generation_observation.call_args.kwargs
         assert call_kwargs["metadata"]["cache_hit"] is False
@@ -329,6 +441,260 @@ class TestHotTakeService:
         with pytest.raises(Exception, match="Agent failed"):
             await service.generate_hot_take(topic="test topic", agent_type="openai")
 
+    @pytest.mark.asyncio
+    @patch("app.services.hot_take_service.OpenAIAgent")
+    @patch("app.services.hot_take_service.AnthropicAgent")
+    async def test_concurrent_non_search_requests_generate_distinct_variants(
+        self, mock_anthropic, mock_openai
+    ):
+        release = asyncio.Event()
+        takes = iter(["Variant one", "Variant two"])
+
+        async def generate(*args):
+            await release.wait()
+            return next(takes)
+
+        mock_openai_instance = AsyncMock()
+        mock_openai_instance.name = "OpenAI Agent"
+        mock_openai_instance.generate_hot_take.side_effect = generate
+        mock_openai.return_value = mock_openai_instance
+        mock_anthropic.return_value = AsyncMock()
+
+        service = HotTakeService()
+        service.cache._client = None
+
+        tasks = [
+            asyncio.create_task(
+                service.generate_hot_take(topic="test topic", agent_type="openai")
+            )
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert {r.hot_take for r in results} == {"Variant one", "Variant two"}
+        assert mock_openai_instance.generate_hot_take.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("app.services.hot_take_service.OpenAIAgent")
+    @patch("app.services.hot_take_service.AnthropicAgent")
+    async def test_generate_hot_take_reuses_cached_search_backed_take(
+        self, mock_anthropic, mock_openai
+    ):
+        mock_openai_instance = AsyncMock()
+        mock_openai_instance.name = "OpenAI Agent"
+        mock_openai_instance.generate_hot_take.return_value = "Search-backed take"
+        mock_openai.return_value = mock_openai_instance
+        mock_anthropic.return_value = AsyncMock()
+
+        service = HotTakeService()
+        service.web_search_service.search = AsyncMock(return_value=[])
+        service.web_search_service.format_search_context = MagicMock(
+            return_value="web context"
+        )
+
+        for _ in range(2):
+            result = await service.generate_hot_take(
+                topic="test topic", agent_type="openai", use_web_search=True
+            )
+            assert result.hot_take == "Search-backed take"
+            assert result.news_context == "web context"
+
+        mock_openai_instance.generate_hot_take.assert_called_once_with(
+            "test topic", "controversial", "web context"
+        )
+
+    @pytest.mark.asyncio
+    @patch("app.services.hot_take_service.OpenAIAgent")
+    @patch("app.services.hot_take_service.AnthropicAgent")
+    async def test_generate_hot_take_bypass_cache_generates_fresh_take(
+        self, mock_anthropic, mock_openai
+    ):
+        mock_openai_instance = AsyncMock()
+        mock_openai_instance.name = "OpenAI Agent"
+        mock_openai_instance.generate_hot_take.side_effect = ["First", "Fresh"]
+        mock_openai.return_value = mock_openai_instance
+        mock_anthropic.return_value = AsyncMock()
+
+        service = HotTakeService()
+        service.web_search_service.search = AsyncMock(return_value=[])
+        service.web_search_service.format_search_context = MagicMock(
+            return_value="web context"
+        )
+
+        first = await service.generate_hot_take(
+            topic="test topic", agent_type="openai", use_web_search=True
+        )
+        fresh = await service.generate_hot_take(
+            topic="test topic",
+            agent_type="openai",
+            use_web_search=True,
+            bypass_cache=True,
+        )
+        cached = await service.generate_hot_take(
+            topic="test topic", agent_type="openai", use_web_search=True
+        )
+
+        assert first.hot_take == "First"
+        assert fresh.hot_take == "Fresh"
+        # The fresh take replaces the cached one for later requests.
+        assert cached.hot_take == "Fresh"
+        assert mock_openai_instance.generate_hot_take.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("app.services.hot_take_service.OpenAIAgent")
+    @patch("app.services.hot_take_service.AnthropicAgent")
+    async def test_generate_hot_takes_batches_styles(self, mock_anthropic, mock_openai):
+        mock_openai_instance = AsyncMock()
+        mock_openai_instance.name = "OpenAI Agent"
+        mock_openai_instance.generate_hot_takes.return_value = ["Witty", "Absurd"]
+        mock_openai.return_value = mock_openai_instance
+        mock_anthropic.return_value = AsyncMock()
+
+        service = HotTakeService()
+        results = await service.generate_hot_takes(
+            topic="test topic", styles=["witty", "absurd"], agent_type="openai"
+        )
+
+        assert [r.hot_take for r in results] == ["Witty", "Absurd"]
+        assert [r.style for r in results] == ["witty", "absurd"]
+        mock_openai_instance.generate_hot_takes.assert_called_once_with(
+            "test topic", ["witty", "absurd"], None
+        )
+
+    @pytest.mark.asyncio
+    @patch("app.services.hot_take_service.OpenAIAgent")
+    @patch("app.services.hot_take_service.AnthropicAgent")
+    async def test_keep_alive_pings_every_agent_and_survives_failures(
+        self, mock_anthropic, mock_openai
+    ):
+        mock_openai_instance = AsyncMock()
+        mock_openai_instance.ping.side_effect = RuntimeError("network down")
+        mock_openai.return_value = mock_openai_instance
+        mock_anthropic_instance = AsyncMock()
+        mock_anthropic.return_value = mock_anthropic_instance
+
+        service = HotTakeService()
+        task = asyncio.create_task(service.keep_alive(0))
+        while mock_anthropic_instance.ping.await_count < 2:
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert mock_openai_instance.ping.await_count >= 2
+
+    @pytest.mark.asyncio
+    @patch("app.services.hot_take_service.OpenAIAgent")
+    @patch("app.services.hot_take_service.AnthropicAgent")
+    async def test_gather_search_context_runs_searches_concurrently(
+        self, mock_anthropic, mock_openai
+    ):
+        mock_openai.return_value = AsyncMock()
+        mock_anthropic.return_value = AsyncMock()
+        service = HotTakeService()
+
+        both_started = asyncio.Event()
+        started = []
+
+        async def search(*args, **kwargs):
+            started.append(True)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return []
+
+        service.web_search_service.search = search
+        service.web_search_service.format_search_context = MagicMock(
+            return_value="web context"
+        )
+        service.news_search_service.search_recent_news = search
+        service.news_search_service.format_news_context = MagicMock(
+            return_value="news context"
+        )
+
+        context, sources = await service._gather_search_context(
+            "test topic",
+            use_web_search=True,
+            use_news_search=True,
+            max_articles=3,
+            web_search_provider=None,
+            news_days=14,
+            strict_quality_mode=False,
+        )
+
+        assert context == "web context\n\nnews context"
+        assert sources == []
+
+    @pytest.mark.asyncio
+    @patch("app.services.hot_take_service.OpenAIAgent")
+    @patch("app.services.hot_take_service.AnthropicAgent")
+    async def test_gather_search_context_drops_news_duplicating_web_results(
+        self, mock_anthropic, mock_openai
+    ):
+        mock_openai.return_value = AsyncMock()
+        mock_anthropic.return_value = AsyncMock()
+        service = HotTakeService()
+        service.web_search_service.search = AsyncMock(
+            return_value=[{"title": "Shared", "url": "https://www.example.com/a/"}]
+        )
+        service.news_search_service.search_recent_news = AsyncMock(
+            return_value=[
+                {"title": "Shared", "url": "https://example.com/a"},
+                {"title": "News only", "url": "https://news.example.com/b"},
+            ]
+        )
+
+        context, sources = await service._gather_search_context(
+            "test topic",
+            use_web_search=True,
+            use_news_search=True,
+            max_articles=3,
+            web_search_provider=None,
+            news_days=14,
+            strict_quality_mode=False,
+        )
+
+        assert [(s.type, s.title) for s in sources] == [
+            ("web", "Shared"),
+            ("news", "News only"),
+        ]
+        assert context.count("Shared") == 1
+
+    @pytest.mark.asyncio
+    @patch.object(settings, "search_context_max_tokens", 60)
+    @patch("app.services.hot_take_service.OpenAIAgent")
+    @patch("app.services.hot_take_service.AnthropicAgent")
+    async def test_gather_search_context_trims_to_token_budget(
+        self, mock_anthropic, mock_openai
+    ):
+        mock_openai.return_value = AsyncMock()
+        mock_anthropic.return_value = AsyncMock()
+        service = HotTakeService()
+        service.news_search_service.search_recent_news = AsyncMock(
+            return_value=[
+                {"title": f"Story {i}", "url": f"https://example.com/{i}"}
+                for i in range(10)
+            ]
+        )
+
+        context, sources = await service._gather_search_context(
+            "test topic",
+            use_web_search=False,
+            use_news_search=True,
+            max_articles=10,
+            web_search_provider=None,
+            news_days=14,
+            strict_quality_mode=False,
+        )
+
+        assert len(context.encode()) / 4 <= 60
+        assert 0 < len(sources) < 10
+        # Lowest-ranked stories are dropped first, so the top one survives.
+        assert sources[0].title == "Story 0"
+        assert all(source.title in context for source in sources)
+
 
 class TestServiceIntegration:
     @pytest.mark.asyncio
@@ -369,3 +735,12 @@ class TestServiceIntegration:
         # Verify agent names
         assert service.agents["openai"].name == "OpenAI Agent"
         assert service.agents["anthropic"].name == "Claude Agent"
+
+
+def test_count_prompt_tokens_is_memoized():
+    from app.observability.tokens import count_prompt_tokens
+
+    count_prompt_tokens.cache_clear()
+    assert count_prompt_tokens("abcdefghi") == 3
+    assert count_prompt_tokens("abcdefghi") == 3
+    assert count_prompt_tokens.cache_info().hits == 1
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from app.services.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def generate():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "shared take"
+
+    tasks = [asyncio.create_task(flight.do("key", generate)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ["shared take"] * 3
+    assert calls == 1
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_all_waiters():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def failing():
+        await release.wait()
+        raise RuntimeError("upstream failed")
+
+    tasks = [asyncio.create_task(flight.do("key", failing)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_run_independently():
+    flight = SingleFlight()
+    calls = 0
+
+    async def generate():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await flight.do("key", generate) == 1
+    assert await flight.do("key", generate) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_followers():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def generate():
+        await release.wait()
+        return "shared take"
+
+    leader = asyncio.create_task(flight.do("key", generate))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("key", generate))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await follower == "shared take"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_call_is_cancelled_when_all_callers_leave():
+    flight = SingleFlight()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def generate():
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    caller = asyncio.create_task(flight.do("key", generate))
+    await started.wait()
+    caller.cancel()
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert len(flight) == 0
@@ -1,5 +1,6 @@
 """Tests for the SSE streaming endpoint and service."""
 
+import asyncio
 import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -13,7 +14,8 @@ from app.models.schemas import (
     StatusEvent,
     TokenEvent,
 )
-from app.services.hot_take_service import HotTakeService
+from app.services.hot_take_service import HotTakeService, _cached_take_frames
+from app.services.streaming import coalesce_tokens, event_frame, token_frame
 
 
 # ---------------------------------------------------------------------------
@@ -108,10 +110,16 @@ class TestStreamHotTakeService:
 
         service = HotTakeService()
         # Disable cache for this test
-        service.cache.get_random_variant = AsyncMock(return_value=(None, 0))
-        service.cache.add_variant = AsyncMock(return_value=1)
-
+        service.cache.get_random_payload = AsyncMock(return_value=(None, 0))
         events = []
+        seen_at_cache_write = []
+
+        async def add_variant(*args):
+            seen_at_cache_write.extend(e["type"] for e in events)
+            return 1
+
+        service.cache.add_variant_payload = AsyncMock(side_effect=add_variant)
+
         async for chunk in service.stream_hot_take(
             topic="test topic", style="controversial", agent_type="openai"
         ):
@@ -123,6 +131,8 @@ class TestStreamHotTakeService:
         assert "token" in types
         assert "done" in types
         assert types[-1] == "done"
+        # The done event is sent before the Redis write.
+        assert seen_at_cache_write[-1] == "done"
 
         token_texts = [e["text"] for e in events if e["type"] == "token"]
         assert "".join(token_texts) == "Hot take!"
@@ -195,17 +205,19 @@ class TestStreamHotTakeService:
 
         service = HotTakeService()
         service.cache.max_variants = 5
-        service.cache.get_random_variant = AsyncMock(
+        service.cache.get_random_payload = AsyncMock(
             return_value=(
-                {
-                    "hot_take": "Cached hot take",
-                    "topic": "test",
-                    "style": "controversial",
-                    "agent_used": "OpenAI Agent",
-                    "web_search_used": False,
-                    "news_context": None,
-                    "sources": None,
-                },
+                json.dumps(
+                    {
+                        "hot_take": "Cached hot take",
+                        "topic": "test",
+                        "style": "controversial",
+                        "agent_used": "OpenAI Agent",
+                        "web_search_used": False,
+                        "news_context": None,
+                        "sources": None,
+                    }
+                ),
                 5,
             )
         )
@@ -247,7 +259,7 @@ class TestStreamHotTakeService:
         mock_anthropic_cls.return_value = MagicMock()
 
         service = HotTakeService()
-        service.cache.get_random_variant = AsyncMock(return_value=(None, 0))
+        service.cache.get_random_payload = AsyncMock(return_value=(None, 0))
 
         events = []
         async for chunk in service.stream_hot_take(
@@ -287,8 +299,8 @@ class TestStreamHotTakeService:
         mock_start_generation_observation.return_value = generation_cm
 
         service = HotTakeService()
-        service.cache.get_random_variant = AsyncMock(return_value=(None, 0))
-        service.cache.add_variant = AsyncMock(return_value=1)
+        service.cache.get_random_payload = AsyncMock(return_value=(None, 0))
+        service.cache.add_variant_payload = AsyncMock(return_value=1)
 
         async for _chunk in service.stream_hot_take(
             topic="test topic", style="controversial", agent_type="openai"
@@ -414,3 +426,100 @@ class TestStreamingEndpoint:
         response = client.post("/api/generate/stream", json={"topic": "test topic"})
         assert response.status_code == status.HTTP_200_OK
         assert response.headers.get("x-trace-id") == "trace-stream-123"
+
+
+# ---------------------------------------------------------------------------
+# Token coalescing tests
+# ---------------------------------------------------------------------------
+
+
+async def delayed_token_generator(*items):
+    """Async generator yielding (token, delay_before_seconds) pairs."""
+    for token, delay in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield token
+
+
+class TestCoalesceTokens:
+    @pytest.mark.asyncio
+    async def test_first_token_is_not_buffered(self):
+        chunks = [
+            chunk
+            async for chunk in coalesce_tokens(
+                async_token_generator("Hot", " take", "!"), 0.05
+            )
+        ]
+        assert chunks[0] == "Hot"
+        assert "".join(chunks) == "Hot take!"
+
+    @pytest.mark.asyncio
+    async def test_burst_tokens_merge_into_one_chunk(self):
+        chunks = [
+            chunk
+            async for chunk in coalesce_tokens(
+                async_token_generator("a", "b", "c", "d"), 0.05
+            )
+        ]
+        assert chunks == ["a", "bcd"]
+
+    @pytest.mark.asyncio
+    async def test_buffer_flushes_when_upstream_goes_quiet(self):
+        stream = delayed_token_generator(("a", 0), ("b", 0), ("c", 0), ("d", 0.1))
+        chunks = [chunk async for chunk in coalesce_tokens(stream, 0.02)]
+        assert chunks == ["a", "bc", "d"]
+
+    @pytest.mark.asyncio
+    async def test_zero_window_passes_tokens_through(self):
+        chunks = [
+            chunk
+            async for chunk in coalesce_tokens(async_token_generator("a", "b", "c"), 0)
+        ]
+        assert chunks == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_upstream_errors_propagate(self):
+        async def failing():
+            yield "a"
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            async for _ in coalesce_tokens(failing(), 0.05):
+                pass
+
+
+class TestTokenFrame:
+    @pytest.mark.parametrize(
+        "text", ["Hot take!", ' "quoted" ', "line\nbreak", "caf\u00e9 \U0001f525", ""]
+    )
+    def test_matches_token_event_encoding(self, text):
+        expected = f"data: {TokenEvent(text=text).model_dump_json()}\n\n"
+        assert token_frame(text) == expected
+
+    def test_event_frame_wraps_model_json(self):
+        frame = event_frame(TokenEvent(text="hi"))
+        assert frame.startswith("data: ") and frame.endswith("\n\n")
+        assert json.loads(frame[len("data: ") :]) == {"type": "token", "text": "hi"}
+
+
+def test_cached_take_frames_are_built_once_per_payload():
+    payload = json.dumps(
+        {
+            "hot_take": "Cached hot take",
+            "topic": "test",
+            "style": "controversial",
+            "agent_used": "OpenAI Agent",
+        }
+    )
+
+    frames = _cached_take_frames(payload)
+
+    assert _cached_take_frames(payload) is frames
+    assert frames[:-1] == (
+        token_frame("Cached "),
+        token_frame("hot "),
+        token_frame("take"),
+    )
+    done = json.loads(frames[-1][len("data: ") :])
+    assert done["type"] == "done"
+    assert done["hot_take"] == "Cached hot take"
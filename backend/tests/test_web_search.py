@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import patch
 from datetime import datetime, timezone
@@ -92,7 +93,7 @@ class TestNewWebSearchService:
             mock_settings.brave_api_key = None
             service = WebSearchService()
             context = service.format_search_context([])
-            assert "No web search results found" in context
+            assert context is None
 
     def test_format_search_context_with_results(self):
         """Test formatting with results."""
@@ -310,6 +311,38 @@ class TestWebSearchRankingAndFiltering:
                 # normal mode: min(20, 5 * 2) = 10
                 mock_search.assert_called_once_with("AI", 10)
 
+    @pytest.mark.asyncio
+    async def test_search_reuses_results_for_repeat_queries(self):
+        """Test concurrent and repeat searches share one provider call."""
+        with patch(
+            "app.services.search_providers.brave_provider.settings"
+        ) as mock_settings:
+            mock_settings.brave_api_key = "test_key"
+            service = WebSearchService(provider_name="brave")
+            result = {
+                "title": "AI news",
+                "url": "https://example.com/ai",
+                "snippet": "AI news",
+                "source": "example.com",
+                "published": None,
+            }
+
+            with patch.object(
+                service.provider, "search", return_value=[result]
+            ) as mock_search:
+                first, second = await asyncio.gather(
+                    service.search("AI", max_results=2),
+                    service.search(" ai", max_results=2),
+                )
+                third = await service.search("AI", max_results=2)
+
+                assert first == second == third
+                assert len(first) == 1
+                mock_search.assert_called_once()
+
+                await service.search("AI", max_results=3)
+                assert mock_search.call_count == 2
+
 
 class TestWebSearchIntegration:
     """Test web search integration with the hot take service"""
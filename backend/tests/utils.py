@@ -50,6 +50,27 @@ def create_mock_anthropic_response(content: str) -> MagicMock:
     return mock_response
 
 
+def create_mock_openai_chunk(content: str | None) -> MagicMock:
+    """Create a mock OpenAI streaming chunk"""
+    mock_chunk = MagicMock()
+    mock_chunk.choices = [MagicMock()]
+    mock_chunk.choices[0].delta.content = content
+    return mock_chunk
+
+
+def create_mock_anthropic_stream(*texts: str) -> "AsyncContextManager":
+    """Create a mock Anthropic ``messages.stream`` context manager"""
+    mock_stream = MagicMock()
+    mock_stream.text_stream = async_iterate(*texts)
+    return AsyncContextManager(mock_stream)
+
+
+async def async_iterate(*items):
+    """Async generator that yields the provided items"""
+    for item in items:
+        yield item
+
+
 class AsyncContextManager:
     """Helper for testing async context managers"""
 